@@ -1,6 +1,8 @@
 import ssl
 import logging
+import random
 import threading
+from types import SimpleNamespace
 from django.conf import settings
 
 try:
@@ -15,17 +17,28 @@ class ActiveMQConnectionManager:
     """
     _instance = None
     _lock = threading.Lock()
-    
+
+    # Reconnect backoff: base * 2**attempt seconds, capped, plus up to
+    # base seconds of jitter so restarted brokers are not hit in lockstep.
+    RECONNECT_BASE_DELAY = 10
+    RECONNECT_MAX_DELAY = 600
+
     def __new__(cls):
-        if cls._instance is None:
+        # Fast path is a single attribute read; the lock is only taken
+        # while the instance is being created. One-time setup lives in
+        # _bootstrap() rather than __init__, so repeated
+        # ActiveMQConnectionManager() calls do no per-call work.
+        instance = cls._instance
+        if instance is None:
             with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-        return cls._instance
-    
-    def __init__(self):
-        if hasattr(self, 'initialized'):
-            return
+                instance = cls._instance
+                if instance is None:
+                    instance = super().__new__(cls)
+                    instance._bootstrap()
+                    cls._instance = instance
+        return instance
+
+    def _bootstrap(self):
         self.conn = None
         self.listener = None
         # Only processes that own the database-saving listener should subscribe
@@ -34,37 +47,81 @@ class ActiveMQConnectionManager:
         # duplicate-message bug when MCP moved to the ASGI worker. apps.py
         # flips this True before calling connect() in the listener process.
         self._should_subscribe = False
-        self.initialized = True
+        self._config = None
+        # Held across connect()/reconnect()/disconnect(). The background
+        # connect started from apps.py, a scheduled reconnect and
+        # send_message()'s lazy connect can run at the same time, and each
+        # replaces self.conn and self.listener; unserialized, two of them
+        # could leave two subscribed connections writing every message twice.
+        self._connect_lock = threading.RLock()
+        self._reconnect_lock = threading.Lock()
+        self._reconnect_timer = None
+        self._reconnect_attempt = 0
         self.logger = logging.getLogger(__name__)
-    
+
+    @property
+    def config(self):
+        """ActiveMQ settings, read once and reused across reconnects."""
+        if self._config is None:
+            self._config = self._read_config()
+        return self._config
+
+    @staticmethod
+    def _read_config():
+        return SimpleNamespace(
+            host=getattr(settings, 'ACTIVEMQ_HOST', 'localhost'),
+            port=getattr(settings, 'ACTIVEMQ_PORT', 61612),
+            use_ssl=getattr(settings, 'ACTIVEMQ_USE_SSL', False),
+            user=getattr(settings, 'ACTIVEMQ_USER', 'admin'),
+            password=getattr(settings, 'ACTIVEMQ_PASSWORD', 'admin'),
+            topic=getattr(settings, 'ACTIVEMQ_HEARTBEAT_TOPIC', 'epictopic'),
+            ssl_ca_certs=getattr(settings, 'ACTIVEMQ_SSL_CA_CERTS', ''),
+            ssl_cert_file=getattr(settings, 'ACTIVEMQ_SSL_CERT_FILE', ''),
+            ssl_key_file=getattr(settings, 'ACTIVEMQ_SSL_KEY_FILE', ''),
+        )
+
+    def reload_config(self):
+        """Re-read ActiveMQ settings on the next connect (e.g. after override_settings)."""
+        self._config = None
+
     def connect(self):
         """Establish connection to ActiveMQ"""
         if stomp is None:
             self.logger.error("stomp.py library not available - cannot connect to ActiveMQ")
             return False
-            
-        if self.conn and self.conn.is_connected():
-            self.logger.debug("ActiveMQ already connected")
-            return True
-            
+
+        with self._connect_lock:
+            # Re-checked under the lock: a caller that waited here may find
+            # the connection another thread was making already up.
+            if self.is_connected():
+                self.logger.debug("ActiveMQ already connected")
+                return True
+            return self._connect()
+
+    def _connect(self):
+        """Open the connection and attach the listener; caller holds _connect_lock."""
         try:
-            host = getattr(settings, 'ACTIVEMQ_HOST', 'localhost')
-            port = getattr(settings, 'ACTIVEMQ_PORT', 61612)
-            
-            self.logger.info(f"Connecting to ActiveMQ at {host}:{port}")
+            cfg = self.config
+            host = cfg.host
+            port = cfg.port
+
+            self.logger.info("Connecting to ActiveMQ at %s:%s", host, port)
             
             # Create connection matching working example agents
             # Use heartbeats parameter like swf-common-lib does
             heartbeats = (5000, 10000)  # (client, server) heartbeats in milliseconds
+            # auto_decode=False: frame bodies arrive as bytes and go straight
+            # to the JSON parser, skipping a per-frame UTF-8 decode to str.
             self.conn = stomp.Connection(
                 host_and_ports=[(host, port)],
-                vhost=host, 
+                vhost=host,
                 try_loopback_connect=False,
-                heartbeats=heartbeats
+                heartbeats=heartbeats,
+                auto_decode=False
             )
             
             # Configure SSL if enabled - MUST be done before set_listener
-            if getattr(settings, 'ACTIVEMQ_USE_SSL', False):
+            if cfg.use_ssl:
                 self._configure_ssl(host, port)
             
             # Set up message listener
@@ -73,13 +130,11 @@ class ActiveMQConnectionManager:
             self.conn.set_listener('', self.listener)
             
             # Connect and subscribe with proper STOMP version and headers
-            user = getattr(settings, 'ACTIVEMQ_USER', 'admin')
-            password = getattr(settings, 'ACTIVEMQ_PASSWORD', 'admin')
-            topic = getattr(settings, 'ACTIVEMQ_HEARTBEAT_TOPIC', 'epictopic')
-            
+            topic = cfg.topic
+
             self.conn.connect(
-                user,
-                password,
+                cfg.user,
+                cfg.password,
                 wait=True,
                 version='1.1',
                 headers={
@@ -90,22 +145,24 @@ class ActiveMQConnectionManager:
             if self._should_subscribe:
                 # Subscribe to workflow topic (broadcast messages from agents)
                 self.conn.subscribe(destination=topic, id=1, ack='auto')
-                self.logger.info(f"Successfully connected to ActiveMQ and subscribed to {topic}")
+                self.logger.info("Successfully connected to ActiveMQ and subscribed to %s", topic)
             else:
-                self.logger.info(f"Successfully connected to ActiveMQ (send-only, no subscribe)")
+                self.logger.info("Successfully connected to ActiveMQ (send-only, no subscribe)")
+            self._reconnect_attempt = 0
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to connect to ActiveMQ: {e}")
+            self.logger.error("Failed to connect to ActiveMQ: %s", e)
             self.conn = None
             return False
     
     def _configure_ssl(self, host, port):
         """Configure SSL for ActiveMQ connection"""
         try:
-            ssl_ca_certs = getattr(settings, 'ACTIVEMQ_SSL_CA_CERTS', '')
-            ssl_cert_file = getattr(settings, 'ACTIVEMQ_SSL_CERT_FILE', '')
-            ssl_key_file = getattr(settings, 'ACTIVEMQ_SSL_KEY_FILE', '')
+            cfg = self.config
+            ssl_ca_certs = cfg.ssl_ca_certs
+            ssl_cert_file = cfg.ssl_cert_file
+            ssl_key_file = cfg.ssl_key_file
             
             if ssl_ca_certs:
                 ssl_args = {
@@ -122,31 +179,62 @@ class ActiveMQConnectionManager:
                     for_hosts=[(host, port)],
                     **ssl_args
                 )
-                self.logger.info(f"SSL configured with CA certs: {ssl_ca_certs}")
+                self.logger.info("SSL configured with CA certs: %s", ssl_ca_certs)
             else:
                 self.logger.warning("SSL enabled but no CA certificate file specified")
                 
         except Exception as e:
-            self.logger.error(f"Failed to configure SSL: {e}")
+            self.logger.error("Failed to configure SSL: %s", e)
             raise
     
     def disconnect(self):
         """Disconnect from ActiveMQ"""
-        if self.conn and self.conn.is_connected():
-            try:
-                self.conn.disconnect()
-                self.logger.info("Disconnected from ActiveMQ")
-            except Exception as e:
-                self.logger.error(f"Error disconnecting from ActiveMQ: {e}")
-        self.conn = None
-        self.listener = None
+        with self._connect_lock:
+            if self.conn and self.conn.is_connected():
+                try:
+                    self.conn.disconnect()
+                    self.logger.info("Disconnected from ActiveMQ")
+                except Exception as e:
+                    self.logger.error("Error disconnecting from ActiveMQ: %s", e)
+            self.conn = None
+            self.listener = None
     
     def reconnect(self):
         """Attempt to reconnect to ActiveMQ"""
         self.logger.info("Attempting to reconnect to ActiveMQ...")
-        self.disconnect()
-        return self.connect()
+        with self._connect_lock:
+            self.disconnect()
+            return self.connect()
     
+    def schedule_reconnect(self):
+        """
+        Schedule one reconnect attempt with exponential backoff and jitter.
+
+        Disconnect callbacks that arrive while an attempt is pending are
+        folded into it, so a flapping broker never fans out reconnects.
+        """
+        with self._reconnect_lock:
+            if self._reconnect_timer is not None:
+                return
+            attempt = self._reconnect_attempt
+            delay = min(self.RECONNECT_MAX_DELAY,
+                        self.RECONNECT_BASE_DELAY * 2 ** attempt)
+            delay += random.uniform(0, self.RECONNECT_BASE_DELAY)
+            self._reconnect_attempt = attempt + 1
+            self._reconnect_timer = threading.Timer(delay, self._run_scheduled_reconnect)
+            self._reconnect_timer.daemon = True
+            self._reconnect_timer.start()
+        self.logger.info("ActiveMQ reconnect attempt %s in %.1fs", attempt + 1, delay)
+
+    def _run_scheduled_reconnect(self):
+        with self._reconnect_lock:
+            self._reconnect_timer = None
+        if self.is_connected():
+            self._reconnect_attempt = 0
+            return
+        if not self.reconnect():
+            self.schedule_reconnect()
+
     def is_connected(self):
         """Check if connection is active"""
         return self.conn and self.conn.is_connected()
@@ -169,8 +257,8 @@ class ActiveMQConnectionManager:
 
         try:
             self.conn.send(destination=destination, body=body)
-            self.logger.info(f"Sent message to {destination}")
+            self.logger.info("Sent message to %s", destination)
             return True
         except Exception as e:
-            self.logger.error(f"Failed to send message to {destination}: {e}")
+            self.logger.error("Failed to send message to %s: %s", destination, e)
             return False
\ No newline at end of file
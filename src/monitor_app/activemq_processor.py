@@ -1,9 +1,10 @@
 import json
 import logging
+import queue
 import threading
-import time
 from django.utils import timezone
-from django.db import connection
+from django.db import transaction
+from .batch_queue import BatchQueue, ensure_usable_connection
 from .models import SystemAgent
 from .run_state_transitions import apply_run_lifecycle_message
 from .workflow_models import WorkflowMessage
@@ -16,6 +17,87 @@ try:
 except ImportError:
     stomp = None
 
+
+# A frame carrying both of these keys is an agent heartbeat; otherwise a
+# frame with 'msg_type' is a workflow message.
+_HEARTBEAT_KEYS = frozenset(('agent_name', 'status'))
+
+
+class WorkflowMessageWriter:
+    """
+    Background batch writer for WorkflowMessage rows.
+
+    The stomp reader thread enqueues unsaved WorkflowMessage instances;
+    a BatchQueue thread drains them with one bulk_create per batch, so a
+    burst of frames costs one INSERT round trip per batch rather than one
+    per message. A batch is flushed when it reaches batch_size or
+    flush_interval seconds after its first message, whichever comes
+    first. The thread starts on the first put(), so processes that only
+    send never run it.
+    """
+
+    def __init__(self, batch_size=500, flush_interval=0.2, queue_size=10000):
+        self.logger = logging.getLogger(__name__)
+        self.batch_size = batch_size
+        self.batches = BatchQueue(
+            self._write, "WorkflowMessageWriter",
+            batch_size=batch_size, flush_interval=flush_interval,
+            queue_size=queue_size,
+        )
+
+    def put(self, message):
+        """Queue an unsaved WorkflowMessage for the next batch."""
+        try:
+            self.batches.put_nowait(message)
+        except queue.Full:
+            # Never drop a workflow message: write it inline instead.
+            self.logger.warning("WorkflowMessage queue full - writing inline")
+            self._write([message])
+
+    def _write(self, batch):
+        try:
+            with transaction.atomic():
+                WorkflowMessage.objects.bulk_create(batch, batch_size=self.batch_size)
+            return
+        except Exception as e:
+            if len(batch) == 1:
+                self._log_failed(batch[0], e)
+                return
+            self.logger.warning(
+                "Batch write of %s workflow messages failed (%s) - retrying one at a time",
+                len(batch), e)
+        # One bad row (an over-long field, say) must not take the rest
+        # of its batch with it.
+        for message in batch:
+            try:
+                message.save(force_insert=True)
+            except Exception as e:
+                self._log_failed(message, e)
+
+    def _log_failed(self, message, error):
+        self.logger.error(
+            "Failed to write workflow message %s from %s (namespace %s): %s",
+            message.message_type, message.sender_agent, message.namespace, error)
+
+    def close(self):
+        """Flush queued messages and stop the writer thread."""
+        self.batches.close()
+
+
+_message_writer = None
+_message_writer_lock = threading.Lock()
+
+
+def get_message_writer():
+    """Return the process-wide WorkflowMessageWriter, starting it on first use."""
+    global _message_writer
+    if _message_writer is None:
+        with _message_writer_lock:
+            if _message_writer is None:
+                _message_writer = WorkflowMessageWriter()
+    return _message_writer
+
+
 class WorkflowMessageProcessor(stomp.ConnectionListener if stomp else object):
     """
     ActiveMQ message processor that handles both heartbeat and workflow messages.
@@ -25,53 +107,46 @@ class WorkflowMessageProcessor(stomp.ConnectionListener if stomp else object):
     def __init__(self, connection_manager):
         self.logger = logging.getLogger(__name__)
         self.connection_manager = connection_manager
-        self.reconnect_delay = 10  # seconds
+        # Shared across reconnects: connect() builds a new processor each time.
+        self.message_writer = get_message_writer()
         
     def on_message(self, frame):
         """Process incoming ActiveMQ messages"""
         try:
-            # Close any lingering database connections to prevent connection leaks
-            connection.close()
+            # Reuse the thread's connection unless it is no longer usable.
+            ensure_usable_connection()
             
+            # Frame bodies arrive as bytes (the connection does not
+            # auto-decode); json.loads detects the encoding itself.
             data = json.loads(frame.body)
             
-            if self._is_heartbeat_message(data):
+            if not isinstance(data, dict):
+                # Valid JSON, but not an object: nothing to dispatch on.
+                self.logger.debug("Unrecognized message format: %s", frame.body)
+                return
+
+            keys = data.keys()
+            if _HEARTBEAT_KEYS <= keys:
                 self._process_heartbeat(data)
-            elif self._is_workflow_message(data):
+            elif 'msg_type' in keys:
                 self._process_workflow_message(data, frame)
             else:
-                self.logger.debug(f"Unrecognized message format: {frame.body}")
+                self.logger.debug("Unrecognized message format: %s", frame.body)
                 
         except json.JSONDecodeError:
-            self.logger.error(f"Failed to decode JSON from message: {frame.body}")
+            self.logger.error("Failed to decode JSON from message: %s", frame.body)
         except Exception as e:
-            self.logger.error(f"Error processing message: {e}")
-            self.logger.debug(f"Message body: {frame.body}")
+            self.logger.error("Error processing message: %s", e)
+            self.logger.debug("Message body: %s", frame.body)
     
     def on_error(self, frame):
         """Handle ActiveMQ errors"""
-        self.logger.error(f"ActiveMQ error: {frame.body}")
+        self.logger.error("ActiveMQ error: %s", frame.body)
     
     def on_disconnected(self):
         """Handle disconnection from ActiveMQ"""
         self.logger.warning("Disconnected from ActiveMQ - scheduling reconnection")
-        
-        # Schedule reconnection in a separate thread to avoid blocking
-        def delayed_reconnect():
-            time.sleep(self.reconnect_delay)
-            if not self.connection_manager.is_connected():
-                self.connection_manager.reconnect()
-        
-        thread = threading.Thread(target=delayed_reconnect, daemon=True)
-        thread.start()
-    
-    def _is_heartbeat_message(self, data):
-        """Check if message is an agent heartbeat"""
-        return 'agent_name' in data and 'status' in data
-    
-    def _is_workflow_message(self, data):
-        """Check if message is a workflow message"""
-        return 'msg_type' in data
+        self.connection_manager.schedule_reconnect()
     
     def _process_heartbeat(self, data):
         """Process agent heartbeat messages to update SystemAgent records"""
@@ -79,33 +154,33 @@ class WorkflowMessageProcessor(stomp.ConnectionListener if stomp else object):
         status = data.get('status')
         
         if not agent_name:
-            self.logger.warning(f"Heartbeat message missing agent_name: {data}")
+            self.logger.warning("Heartbeat message missing agent_name: %s", data)
             return
         
         try:
-            agent, created = SystemAgent.objects.get_or_create(
-                instance_name=agent_name,
-                defaults={
-                    'agent_type': 'Unknown',
-                    'status': status if status else 'UNKNOWN',
-                    'last_heartbeat': timezone.now(),
-                    'workflow_enabled': True  # All agents are workflow-enabled by default
-                }
-            )
-            
-            if not created:
-                if status:
-                    agent.status = status
-                agent.last_heartbeat = timezone.now()
-                # Ensure existing agents are marked as workflow-enabled
-                if not agent.workflow_enabled:
-                    agent.workflow_enabled = True
-                agent.save()
-            
-            self.logger.debug(f"Updated SystemAgent {agent_name} with status {agent.status}")
+            now = timezone.now()
+            # Steady state is an existing agent: one UPDATE, no SELECT.
+            # Existing agents are always marked workflow-enabled.
+            fields = {'last_heartbeat': now, 'workflow_enabled': True, 'updated_at': now}
+            if status:
+                fields['status'] = status
+            updated = SystemAgent.objects.filter(instance_name=agent_name).update(**fields)
+
+            if not updated:
+                SystemAgent.objects.get_or_create(
+                    instance_name=agent_name,
+                    defaults={
+                        'agent_type': 'Unknown',
+                        'status': status if status else 'UNKNOWN',
+                        'last_heartbeat': now,
+                        'workflow_enabled': True  # All agents are workflow-enabled by default
+                    }
+                )
+
+            self.logger.debug("Updated SystemAgent %s with status %s", agent_name, status or 'unchanged')
             
         except Exception as e:
-            self.logger.error(f"Error processing heartbeat for agent {agent_name}: {e}")
+            self.logger.error("Error processing heartbeat for agent %s: %s", agent_name, e)
     
     def _process_workflow_message(self, data, frame):
         """Process workflow messages and store them in WorkflowMessage model"""
@@ -129,8 +204,8 @@ class WorkflowMessageProcessor(stomp.ConnectionListener if stomp else object):
                 'django_instance': os.environ.get('DJANGO_SETTINGS_MODULE', 'unknown')
             }
 
-            # Create WorkflowMessage record
-            workflow_message = WorkflowMessage.objects.create(
+            # Queue the WorkflowMessage record for the batch writer
+            self.message_writer.put(WorkflowMessage(
                 workflow=None,
                 message_type=msg_type,
                 sender_agent=sender_agent,
@@ -143,7 +218,7 @@ class WorkflowMessageProcessor(stomp.ConnectionListener if stomp else object):
                 sent_at=timezone.now(),
                 queue_name=getattr(frame, 'destination', 'epictopic'),
                 is_successful=True  # Assume successful since we received it
-            )
+            ))
 
             # Apply run lifecycle transitions to RunState — the E1 mirror
             # of the E0-E1 state stamps these messages carry. Failures are
@@ -152,8 +227,8 @@ class WorkflowMessageProcessor(stomp.ConnectionListener if stomp else object):
                 apply_run_lifecycle_message(data)
             except Exception as e:
                 self.logger.error(
-                    f"RunState transition failed for {msg_type} "
-                    f"run {run_id}: {e}")
+                    "RunState transition failed for %s run %s: %s",
+                    msg_type, run_id, e)
 
             # Enrich message for downstream consumers (SSE filters rely on these)
             enriched = dict(data)
@@ -173,7 +248,7 @@ class WorkflowMessageProcessor(stomp.ConnectionListener if stomp else object):
                         {"type": "broadcast", "payload": enriched}
                     )
             except Exception as e:
-                self.logger.debug(f"Channels group_send failed or unavailable: {e}")
+                self.logger.debug("Channels group_send failed or unavailable: %s", e)
 
             # Also attempt in-process broadcast (useful in single-process dev)
             try:
@@ -181,11 +256,13 @@ class WorkflowMessageProcessor(stomp.ConnectionListener if stomp else object):
                 broadcaster = SSEMessageBroadcaster()
                 broadcaster.broadcast_message(enriched)
             except Exception as e:
-                self.logger.debug(f"In-process SSE broadcast skipped/failed: {e}")
+                self.logger.debug("In-process SSE broadcast skipped/failed: %s", e)
             
-            self.logger.info(f"Stored and relayed workflow message: {msg_type} for run {run_id}, filename {filename}")
+            # Per-message trace only: the WorkflowMessage row is the record,
+            # and at INFO this would also write an AppLog row per message.
+            self.logger.debug("Queued and relayed workflow message: %s for run %s, filename %s", msg_type, run_id, filename)
             
         except Exception as e:
-            self.logger.error(f"Error processing workflow message: {e}")
-            self.logger.debug(f"Message data: {data}")
+            self.logger.error("Error processing workflow message: %s", e)
+            self.logger.debug("Message data: %s", data)
     
@@ -43,65 +43,92 @@ router.register(r'workers', WorkerViewSet, basename='worker')
 router.register(r'run-states', RunStateViewSet, basename='runstate')
 router.register(r'system-state-events', SystemStateEventViewSet, basename='systemstateevent')
 
-urlpatterns = [
-    path('logs/summary/', LogSummaryView.as_view(), name='log-summary'),
-    path('state/next-run-number/', get_next_run_number, name='get-next-run-number'),
-    path('state/next-agent-id/', get_next_agent_id, name='get-next-agent-id'),
-    path('state/next-workflow-execution-id/', get_next_workflow_execution_id, name='get-next-workflow-execution-id'),
-    path('namespaces/ensure/', ensure_namespace, name='ensure-namespace'),
-    path('ai-memory/record/', ai_memory_record, name='ai-memory-record'),
-    path('ai-memory/', ai_memory_load, name='ai-memory-load'),
-    path('dpid/verify/', dpid_verify, name='dpid-verify'),
-    path('slash/panda/', panda_slash_command, name='panda-slash-command'),
-    path('corun-callback/', corun_callback, name='corun-callback'),
-    # PanDA REST API — read-only JSON for external consumers.
-    # See monitor_app/panda/api.py.
-    path('panda/tasks/', panda_api.tasks_list, name='panda-api-tasks-list'),
-    path('panda/tasks/<int:jeditaskid>/', panda_api.task_detail, name='panda-api-task-detail'),
-    path('panda/tasks/<int:jeditaskid>/operations/',
+# Endpoints sharing a leading segment are grouped under include() so the
+# resolver tests the prefix once and skips the whole group on a miss.
+# Names and paths are unchanged — the includes carry no namespace.
+state_urlpatterns = [
+    path('next-run-number/', get_next_run_number, name='get-next-run-number'),
+    path('next-agent-id/', get_next_agent_id, name='get-next-agent-id'),
+    path('next-workflow-execution-id/', get_next_workflow_execution_id, name='get-next-workflow-execution-id'),
+]
+
+ai_memory_urlpatterns = [
+    path('record/', ai_memory_record, name='ai-memory-record'),
+    path('', ai_memory_load, name='ai-memory-load'),
+]
+
+# PanDA REST API — read-only JSON for external consumers.
+# See monitor_app/panda/api.py.
+panda_urlpatterns = [
+    path('tasks/', panda_api.tasks_list, name='panda-api-tasks-list'),
+    path('tasks/<int:jeditaskid>/', panda_api.task_detail, name='panda-api-task-detail'),
+    path('tasks/<int:jeditaskid>/operations/',
          panda_api.task_operation_request,
          name='panda-task-operation-request'),
-    path('panda/task-operations/',
+    path('task-operations/',
          panda_api.task_operations_request,
          name='panda-task-operations-request'),
-    path('panda/task-operations/<uuid:operation_id>/',
+    path('task-operations/<uuid:operation_id>/',
          panda_api.task_operation_detail,
          name='panda-task-operation-detail'),
-    path('panda/task-operations/<uuid:operation_id>/state/',
+    path('task-operations/<uuid:operation_id>/state/',
          panda_api.task_operation_update,
          name='panda-task-operation-update'),
-    path('panda/jobs/', panda_api.jobs_list, name='panda-api-jobs-list'),
-    path('panda/activity/', panda_api.activity, name='panda-api-activity'),
-    path('users/', users_list, name='users-list'),
+    path('jobs/', panda_api.jobs_list, name='panda-api-jobs-list'),
+    path('activity/', panda_api.activity, name='panda-api-activity'),
+]
+
+snapper_urlpatterns = [
     # Episode ingest (token-authenticated writes from the episode
     # builder agent) and read surfaces; snapper_episodes_api.py.
-    path('snapper/episodes/open/', episodes_open, name='snapper-episodes-open'),
-    path('snapper/episodes/append/', episodes_append,
+    path('episodes/open/', episodes_open, name='snapper-episodes-open'),
+    path('episodes/append/', episodes_append,
          name='snapper-episodes-append'),
-    path('snapper/episodes/close/', episodes_close,
+    path('episodes/close/', episodes_close,
          name='snapper-episodes-close'),
-    path('snapper/<str:scope>/episodes/', episodes_list_view,
+    path('<str:scope>/episodes/', episodes_list_view,
          name='snapper-episodes-list'),
-    path('snapper/<str:scope>/episodes/<str:episode_id>/',
+    path('<str:scope>/episodes/<str:episode_id>/',
          episode_detail_view, name='snapper-episode-detail'),
-    path('snapper/<str:scope>/latest/', snapper_latest,
+    path('<str:scope>/latest/', snapper_latest,
          name='snapper-latest'),
-    path('snapper/<str:scope>/state-at/', snapper_state_at,
+    path('<str:scope>/state-at/', snapper_state_at,
          name='snapper-state-at'),
-    path('snapper/<str:scope>/history/', snapper_component_history,
+    path('<str:scope>/history/', snapper_component_history,
          name='snapper-component-history'),
-    path('snapper/<str:scope>/changes/', snapper_changes_between,
+    path('<str:scope>/changes/', snapper_changes_between,
          name='snapper-changes-between'),
-    path('snapper/<str:scope>/context/', snapper_context,
+    path('<str:scope>/context/', snapper_context,
          name='snapper-context'),
+]
+
+capcom_urlpatterns = [
+    path('state/', capcom_state, name='capcom-state'),
+    path('user-state/', capcom_user_state, name='capcom-user-state'),
+    path('notices/', capcom_notices, name='capcom-notices'),
+    path('notices/ingest/', capcom_notice_ingest,
+         name='capcom-notice-ingest'),
+]
+
+sse_urlpatterns = [
+    path('', sse_message_stream, name='sse-message-stream'),
+    path('status/', sse_status, name='sse-stream-status'),
+]
+
+urlpatterns = [
+    path('logs/summary/', LogSummaryView.as_view(), name='log-summary'),
+    path('state/', include(state_urlpatterns)),
+    path('namespaces/ensure/', ensure_namespace, name='ensure-namespace'),
+    path('ai-memory/', include(ai_memory_urlpatterns)),
+    path('dpid/verify/', dpid_verify, name='dpid-verify'),
+    path('slash/panda/', panda_slash_command, name='panda-slash-command'),
+    path('corun-callback/', corun_callback, name='corun-callback'),
+    path('panda/', include(panda_urlpatterns)),
+    path('users/', users_list, name='users-list'),
+    path('snapper/', include(snapper_urlpatterns)),
     path('system-status/history/', system_status_history,
          name='system-status-history'),
-    path('capcom/state/', capcom_state, name='capcom-state'),
-    path('capcom/user-state/', capcom_user_state, name='capcom-user-state'),
-    path('capcom/notices/', capcom_notices, name='capcom-notices'),
-    path('capcom/notices/ingest/', capcom_notice_ingest,
-         name='capcom-notice-ingest'),
-    path('messages/stream/', sse_message_stream, name='sse-message-stream'),
-    path('messages/stream/status/', sse_status, name='sse-stream-status'),
+    path('capcom/', include(capcom_urlpatterns)),
+    path('messages/stream/', include(sse_urlpatterns)),
     path('', include(router.urls)),
 ]
@@ -1,6 +1,7 @@
 import logging
 import atexit
 import sys
+import threading
 from django.apps import AppConfig
 from django.conf import settings
 
@@ -13,6 +14,9 @@ class MonitorAppConfig(AppConfig):
     """
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'monitor_app'
+
+    _activemq_init_lock = threading.Lock()
+    _activemq_started = False
     
     def ready(self):
         """
@@ -51,7 +55,16 @@ class MonitorAppConfig(AppConfig):
         return True
     
     def _initialize_activemq(self):
-        """Initialize ActiveMQ connection and register cleanup handlers"""
+        """
+        Start the ActiveMQ connection in a background thread and register
+        cleanup handlers. The broker handshake is network I/O, so ready()
+        returns without waiting for it.
+        """
+        with self._activemq_init_lock:
+            if MonitorAppConfig._activemq_started:
+                return
+            MonitorAppConfig._activemq_started = True
+
         try:
             from .activemq_connection import ActiveMQConnectionManager
             
@@ -63,18 +76,31 @@ class MonitorAppConfig(AppConfig):
             # stays False and send_message()'s lazy connect stays send-only.
             manager._should_subscribe = True
 
-            # Attempt to connect
-            if manager.connect():
-                # Register cleanup function to run when Django shuts down
-                atexit.register(self._cleanup_activemq, manager)
-                logger.info("ActiveMQ integration initialized successfully")
-            else:
-                logger.warning("Failed to initialize ActiveMQ connection")
-                
+            # Register cleanup function to run when Django shuts down
+            atexit.register(self._cleanup_activemq, manager)
+
+            threading.Thread(
+                target=self._connect_in_background,
+                args=(manager,),
+                name='activemq-init',
+                daemon=True,
+            ).start()
+
         except ImportError as e:
             logger.error(f"Could not import ActiveMQ components: {e}")
         except Exception as e:
             logger.error(f"Failed to initialize ActiveMQ integration: {e}")
+
+    def _connect_in_background(self, manager):
+        """Connect the listener; on failure hand off to the reconnect backoff."""
+        try:
+            if manager.connect():
+                logger.info("ActiveMQ integration initialized successfully")
+                return
+            logger.warning("Failed to initialize ActiveMQ connection")
+        except Exception as e:
+            logger.error(f"Failed to initialize ActiveMQ integration: {e}")
+        manager.schedule_reconnect()
     
     def _cleanup_activemq(self, manager):
         """Clean up ActiveMQ connection on Django shutdown"""
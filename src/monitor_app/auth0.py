@@ -1,25 +1,70 @@
 """Auth0 JWT validation utilities for MCP OAuth 2.1 authentication."""
 
 import logging
+import threading
+import time
 from functools import lru_cache
 
-import requests
 from django.conf import settings
-from jose import jwt, JWTError
+
+# requests and python-jose are imported inside the functions that use
+# them: this module is loaded by the middleware in every worker, but only
+# Bearer-authenticated MCP requests ever validate a token.
 
 logger = logging.getLogger(__name__)
 
-# Cache JWKS for 1 hour (3600 seconds)
-_jwks_cache = {"keys": None, "expires": 0}
+# Cache JWKS for 1 hour (3600 seconds). Held as a (keys, expires) tuple
+# and replaced wholesale so concurrent readers never see a half update;
+# expires is on the monotonic clock so wall-clock steps don't affect it.
+_JWKS_TTL = 3600
+# After a failed refresh, keep serving the stale keys this long before
+# trying Auth0 again, so an outage doesn't cost every request a timeout.
+_JWKS_RETRY_AFTER = 60
+_jwks_cache = (None, 0.0)
+
+# kid -> RSA key dict for jwt.decode, built from the cached JWKS. Cleared
+# whenever the JWKS is refetched so rotated keys are picked up.
+_rsa_key_cache = {}
+
+# Shared HTTP session for JWKS fetches, created on first use.
+_session = None
+_session_lock = threading.Lock()
+
+
+def _get_session():
+    """Return the pooled requests.Session used to fetch the JWKS."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                session = requests.Session()
+                session.mount("https://", HTTPAdapter(
+                    pool_connections=2,
+                    pool_maxsize=4,
+                    max_retries=Retry(total=2, backoff_factor=0.3,
+                                      status_forcelist=[502, 503, 504]),
+                ))
+                _session = session
+    return _session
 
 
 def get_jwks():
-    """Fetch and cache JWKS from Auth0."""
-    import time
+    """
+    Fetch and cache JWKS from Auth0.
+
+    If a refresh fails, the previously fetched JWKS is returned (stale)
+    so token validation keeps working through a brief Auth0 outage.
+    """
+    global _jwks_cache
 
-    now = time.time()
-    if _jwks_cache["keys"] and now < _jwks_cache["expires"]:
-        return _jwks_cache["keys"]
+    keys, expires = _jwks_cache
+    now = time.monotonic()
+    if keys and now < expires:
+        return keys
 
     if not settings.AUTH0_DOMAIN:
         logger.warning("AUTH0_DOMAIN not configured")
@@ -27,16 +72,55 @@ def get_jwks():
 
     jwks_url = f"https://{settings.AUTH0_DOMAIN}/.well-known/jwks.json"
     try:
-        response = requests.get(jwks_url, timeout=10)
+        response = _get_session().get(jwks_url, timeout=10)
         response.raise_for_status()
         jwks = response.json()
-        _jwks_cache["keys"] = jwks
-        _jwks_cache["expires"] = now + 3600  # Cache for 1 hour
-        return jwks
     except Exception as e:
+        if keys:
+            logger.warning(f"Failed to refresh JWKS from Auth0, using cached keys: {e}")
+            _jwks_cache = (keys, now + _JWKS_RETRY_AFTER)
+            return keys
         logger.error(f"Failed to fetch JWKS from Auth0: {e}")
         return None
 
+    _jwks_cache = (jwks, now + _JWKS_TTL)
+    _rsa_key_cache.clear()
+    return jwks
+
+
+def _get_rsa_key(jwks, kid):
+    """Return the RSA key dict for kid from the JWKS, memoized per kid."""
+    rsa_key = _rsa_key_cache.get(kid)
+    if rsa_key is not None:
+        return rsa_key
+    for key in jwks.get("keys", []):
+        if key.get("kid") == kid:
+            rsa_key = {
+                "kty": key["kty"],
+                "kid": key["kid"],
+                "use": key["use"],
+                "n": key["n"],
+                "e": key["e"],
+            }
+            _rsa_key_cache[kid] = rsa_key
+            return rsa_key
+    return None
+
+
+@lru_cache(maxsize=1)
+def _decode_kwargs() -> dict | None:
+    """
+    The jwt.decode() algorithms/audience/issuer arguments, read from
+    settings once. None when Auth0 is not configured.
+    """
+    if not settings.AUTH0_DOMAIN or not settings.AUTH0_API_IDENTIFIER:
+        return None
+    return {
+        "algorithms": settings.AUTH0_ALGORITHMS,
+        "audience": settings.AUTH0_API_IDENTIFIER,
+        "issuer": f"https://{settings.AUTH0_DOMAIN}/",
+    }
+
 
 def validate_token(token: str) -> dict | None:
     """
@@ -44,7 +128,8 @@ def validate_token(token: str) -> dict | None:
 
     Returns the decoded token payload if valid, None otherwise.
     """
-    if not settings.AUTH0_DOMAIN or not settings.AUTH0_API_IDENTIFIER:
+    decode_kwargs = _decode_kwargs()
+    if decode_kwargs is None:
         logger.warning("Auth0 not configured, skipping token validation")
         return None
 
@@ -53,36 +138,20 @@ def validate_token(token: str) -> dict | None:
         logger.warning("Failed to get JWKS")
         return None
 
+    from jose import jwt, JWTError
+
     try:
         # Get the key ID from the token header
         unverified_header = jwt.get_unverified_header(token)
         kid = unverified_header.get("kid")
 
-        # Find the matching key
-        rsa_key = None
-        for key in jwks.get("keys", []):
-            if key.get("kid") == kid:
-                rsa_key = {
-                    "kty": key["kty"],
-                    "kid": key["kid"],
-                    "use": key["use"],
-                    "n": key["n"],
-                    "e": key["e"],
-                }
-                break
-
+        rsa_key = _get_rsa_key(jwks, kid)
         if not rsa_key:
             logger.warning(f"No matching key found for kid: {kid}")
             return None
 
         # Validate the token
-        payload = jwt.decode(
-            token,
-            rsa_key,
-            algorithms=settings.AUTH0_ALGORITHMS,
-            audience=settings.AUTH0_API_IDENTIFIER,
-            issuer=f"https://{settings.AUTH0_DOMAIN}/",
-        )
+        payload = jwt.decode(token, rsa_key, **decode_kwargs)
         return payload
 
     except JWTError as e:
@@ -0,0 +1,138 @@
+"""
+Bounded queue drained in batches by one background thread.
+
+Used by the WorkflowMessage writer (activemq_processor) and the AppLog
+handler (db_log_handler). Producers put items; the thread blocks for the
+first item of a batch, keeps collecting until batch_size items or
+flush_interval seconds have passed, and hands the batch to the write
+callback. close() flushes everything queued before it and stops the thread.
+ensure_usable_connection() is the connection policy for these threads and
+the ActiveMQ listener: one connection kept across units of work.
+"""
+
+import atexit
+import queue
+import sys
+import threading
+import time
+
+
+# A connection left idle this long is checked with a round trip before
+# its next use: the server may have dropped it meanwhile (restart,
+# failover, idle timeout). Work arriving back to back skips the check.
+CONNECTION_IDLE_CHECK_SECONDS = 5.0
+
+_thread_state = threading.local()
+
+
+def ensure_usable_connection():
+    """
+    Keep this thread's DB connection across units of work, replacing it
+    only when it is no longer usable.
+
+    Background threads (the BatchQueue writers, the ActiveMQ listener)
+    never see request_started/finished, and CONN_MAX_AGE stays 0 for the
+    request-serving processes, so they manage their one connection here
+    rather than through close_old_connections(), which would reconnect
+    for every unit of work. The connection is checked after an error, and
+    after an idle gap, so a connection the server dropped is replaced
+    before the next writes rather than failing them.
+    """
+    from django.db import connection
+
+    now = time.monotonic()
+    last_used = getattr(_thread_state, 'last_used', None)
+    _thread_state.last_used = now
+    if connection.connection is None:
+        return
+    idle = last_used is None or now - last_used >= CONNECTION_IDLE_CHECK_SECONDS
+    if connection.errors_occurred or idle:
+        if connection.is_usable():
+            connection.errors_occurred = False
+        else:
+            connection.close()
+
+
+class BatchQueue:
+    """
+    Queue whose items are written in batches by a daemon thread.
+
+    The thread starts on the first put, so a process that never produces
+    items never runs it. write(batch) owns its own error handling; an
+    exception escaping it is reported on stderr and the thread carries on.
+    The thread keeps one database connection across batches, checked by
+    ensure_usable_connection() before each write, and closes it when it
+    stops.
+    """
+
+    _STOP = object()
+
+    def __init__(self, write, name, batch_size, flush_interval, queue_size=10000):
+        self.write = write
+        self.name = name
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue = queue.Queue(maxsize=queue_size)
+        self._worker = None
+        self._start_lock = threading.Lock()
+
+    def put_nowait(self, item):
+        """Queue item for the next batch; raises queue.Full at capacity."""
+        if self._worker is None:
+            self._start()
+        self.queue.put_nowait(item)
+
+    def _start(self):
+        with self._start_lock:
+            if self._worker is None:
+                worker = threading.Thread(target=self._run, name=self.name, daemon=True)
+                worker.start()
+                atexit.register(self.close)
+                self._worker = worker
+
+    def _run(self):
+        try:
+            while True:
+                batch, stop = self._next_batch()
+                if batch:
+                    try:
+                        ensure_usable_connection()
+                        self.write(batch)
+                    except Exception as e:
+                        sys.stderr.write(f"{self.name}: failed to write {len(batch)} item(s): {e}\n")
+                if stop:
+                    return
+        finally:
+            from django.db import connection
+            connection.close()
+
+    def _next_batch(self):
+        """
+        Block for one item, then collect more until batch_size is reached
+        or flush_interval has passed. Returns (items, stop_requested).
+        """
+        item = self.queue.get()
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        while item is not self._STOP:
+            batch.append(item)
+            remaining = deadline - time.monotonic()
+            if len(batch) >= self.batch_size or remaining <= 0:
+                return batch, False
+            try:
+                item = self.queue.get(timeout=remaining)
+            except queue.Empty:
+                return batch, False
+        return batch, True
+
+    def close(self, timeout=5.0):
+        """Write everything queued so far and stop the thread."""
+        worker = self._worker
+        if worker is None or not worker.is_alive():
+            return
+        try:
+            self.queue.put(self._STOP, timeout=timeout)
+        except queue.Full:
+            return
+        if threading.current_thread() is not worker:
+            worker.join(timeout=timeout)
@@ -3,6 +3,7 @@ Database logging handler for Django.
 
 This handler writes log records directly to the AppLog database table,
 enabling monitor-internal logging to be captured alongside agent logs.
+Records are queued by emit() and written in batches by a background thread.
 """
 
 import logging
@@ -11,7 +12,20 @@ import queue
 import socket
 import sys
 import threading
-import time
+from datetime import datetime, timezone as dt_timezone
+
+from .batch_queue import BatchQueue
+
+# LogRecord attributes that are not caller-supplied extras.
+_STANDARD_ATTRS = frozenset({
+    'name', 'msg', 'args', 'created', 'filename', 'funcName',
+    'levelname', 'levelno', 'lineno', 'module', 'msecs',
+    'pathname', 'process', 'processName', 'relativeCreated',
+    'stack_info', 'exc_info', 'exc_text', 'thread', 'threadName',
+    'message', 'asctime'
+})
+
+_default_formatter = logging.Formatter()
 
 
 class DbLogHandler(logging.Handler):
@@ -25,13 +39,13 @@ class DbLogHandler(logging.Handler):
     directly via Django ORM since it runs inside the Django process.
     """
 
-    _STOP = object()
-
     def __init__(
         self,
         app_name: str = 'swf-monitor',
         instance_name: str = None,
         queue_size: int = 10000,
+        batch_size: int = 200,
+        flush_interval: float = 0.25,
     ):
         """
         Initialize the handler.
@@ -39,18 +53,33 @@ class DbLogHandler(logging.Handler):
         Args:
             app_name: Application name for log records (default: 'swf-monitor')
             instance_name: Instance name for log records (default: hostname)
+            batch_size: Most records written per bulk INSERT
+            flush_interval: Seconds to wait for a batch to fill before writing
         """
         super().__init__()
         self.app_name = app_name
         self.instance_name = instance_name or socket.gethostname()
-        self.queue = queue.Queue(maxsize=queue_size)
-        self._dropped = 0
-        self._worker = threading.Thread(
-            target=self._write_loop,
-            name=f"DbLogHandler-{self.app_name}",
-            daemon=True,
+        self.batches = BatchQueue(
+            self._write_batch, f"DbLogHandler-{self.app_name}",
+            batch_size=batch_size, flush_interval=flush_interval,
+            queue_size=queue_size,
         )
-        self._worker.start()
+        self._dropped = 0
+
+    def handle(self, record: logging.LogRecord):
+        """
+        Filter and emit without taking the handler lock.
+
+        emit() only builds a payload from the record and enqueues it, and
+        the queue is thread-safe, so the RLock logging.Handler.handle()
+        holds around emit() would only serialize concurrent loggers.
+        """
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            record = rv
+        if rv:
+            self.emit(record)
+        return rv
 
     def emit(self, record: logging.LogRecord) -> None:
         """
@@ -66,7 +95,7 @@ class DbLogHandler(logging.Handler):
             return
 
         try:
-            self.queue.put_nowait(payload)
+            self.batches.put_nowait(payload)
         except queue.Full:
             self._dropped += 1
             sys.stderr.write(
@@ -75,21 +104,28 @@ class DbLogHandler(logging.Handler):
             )
 
     def _build_payload(self, record: logging.LogRecord) -> dict:
-        message = self.format(record)
-
-        standard_attrs = {
-            'name', 'msg', 'args', 'created', 'filename', 'funcName',
-            'levelname', 'levelno', 'lineno', 'module', 'msecs',
-            'pathname', 'process', 'processName', 'relativeCreated',
-            'stack_info', 'exc_info', 'exc_text', 'thread', 'threadName',
-            'message', 'asctime'
-        }
+        if self.formatter:
+            message = self.format(record)
+        else:
+            # AppLog stores timestamp and level in their own columns, so
+            # without a configured formatter the bare message suffices;
+            # the default formatter would only add traceback/stack, kept here.
+            message = record.getMessage()
+            if record.exc_info:
+                message = f"{message}\n{_default_formatter.formatException(record.exc_info)}"
+            elif record.exc_text:
+                message = f"{message}\n{record.exc_text}"
+            if record.stack_info:
+                message = f"{message}\n{_default_formatter.formatStack(record.stack_info)}"
+
+        attrs = record.__dict__
         extra_data = {
-            k: self._json_safe(v) for k, v in record.__dict__.items()
-            if k not in standard_attrs and not k.startswith('_')
+            k: self._json_safe(attrs[k]) for k in attrs.keys() - _STANDARD_ATTRS
+            if not k.startswith('_')
         }
 
         return {
+            'timestamp': datetime.fromtimestamp(record.created, tz=dt_timezone.utc),
             'app_name': self.app_name,
             'instance_name': self.instance_name,
             'level': record.levelno,
@@ -103,27 +139,19 @@ class DbLogHandler(logging.Handler):
             'extra_data': extra_data if extra_data else None,
         }
 
-    def _write_loop(self) -> None:
-        while True:
-            payload = self.queue.get()
-            try:
-                if payload is self._STOP:
-                    return
-                self._write_payload(payload)
-            finally:
-                self.queue.task_done()
-
-    def _write_payload(self, payload: dict) -> None:
+    def _write_batch(self, batch: list) -> None:
         try:
-            from django.utils import timezone
             from monitor_app.models import AppLog
-            AppLog.objects.create(timestamp=timezone.now(), **payload)
+            AppLog.objects.bulk_create([AppLog(**payload) for payload in batch])
         except Exception as e:
-            sys.stderr.write(f"DbLogHandler: Failed to write log to database: {e}\n")
             sys.stderr.write(
-                "DbLogHandler: Original message: "
-                f"{payload.get('message', '')}\n"
+                f"DbLogHandler: Failed to write {len(batch)} log(s) to database: {e}\n"
             )
+            for payload in batch:
+                sys.stderr.write(
+                    "DbLogHandler: Original message: "
+                    f"{payload.get('message', '')}\n"
+                )
 
     @staticmethod
     def _json_safe(value):
@@ -136,14 +164,6 @@ class DbLogHandler(logging.Handler):
 
     def close(self) -> None:
         try:
-            deadline = time.monotonic() + 2.0
-            while not self.queue.empty() and time.monotonic() < deadline:
-                time.sleep(0.05)
-            try:
-                self.queue.put_nowait(self._STOP)
-            except queue.Full:
-                pass
-            if threading.current_thread() is not self._worker:
-                self._worker.join(timeout=1.0)
+            self.batches.close(timeout=2.0)
         finally:
             super().close()
@@ -2,12 +2,42 @@
 FastMon-specific views for Time Frame file monitoring.
 """
 
+import uuid
+
+from django.db.models import Q
 from django.shortcuts import render
-from django.http import JsonResponse
 from django.urls import reverse
+from .cached_product import get_product
 from .models import FastMonFile
 from .utils import DataTablesProcessor, get_filter_params, format_datetime
 
+# Cell formatters bound once: detail link from (url prefix, id, text), and
+# an integer with thousands separators.
+_LINK = '<a href="{0}{1}/">{2}</a>'.format
+_THOUSANDS = '{:,}'.format
+
+# Status is the one humanly-choosable filter set; filename and run
+# enumerations are not filters — deep-link parameters still apply
+# and search covers targeted lookups.
+_STATUSES = tuple(choice[0] for choice in FastMonFile._meta.get_field('status').choices)
+
+# Column definitions for DataTables
+_LIST_COLUMNS = (
+    {'name': 'tf_filename', 'title': 'TF Filename', 'orderable': True},
+    {'name': 'stf_file__stf_filename', 'title': 'Parent STF', 'orderable': True},
+    {'name': 'stf_file__run__run_number', 'title': 'Run', 'orderable': True},
+    {'name': 'file_size_bytes', 'title': 'Size (bytes)', 'orderable': True},
+    {'name': 'status', 'title': 'Status', 'orderable': True},
+    {'name': 'created_at', 'title': 'Created', 'orderable': True},
+)
+_ORDER_COLUMNS = tuple(column['name'] for column in _LIST_COLUMNS)
+
+
+def _url_prefix(viewname, placeholder):
+    """Return the reversed URL for viewname up to its single path argument."""
+    url = reverse(viewname, args=[placeholder])
+    return url[:url.rindex(str(placeholder))]
+
 
 def fastmon_files_list(request):
     """
@@ -19,27 +49,12 @@ def fastmon_files_list(request):
     status_filter = request.GET.get('status')
     run_number = request.GET.get('run_number')
 
-    # Status is the one humanly-choosable filter set; filename and run
-    # enumerations are not filters — deep-link parameters still apply
-    # and search covers targeted lookups.
-    statuses = [choice[0] for choice in FastMonFile._meta.get_field('status').choices]
-
-    # Column definitions for DataTables
-    columns = [
-        {'name': 'tf_filename', 'title': 'TF Filename', 'orderable': True},
-        {'name': 'stf_file__stf_filename', 'title': 'Parent STF', 'orderable': True},
-        {'name': 'stf_file__run__run_number', 'title': 'Run', 'orderable': True},
-        {'name': 'file_size_bytes', 'title': 'Size (bytes)', 'orderable': True},
-        {'name': 'status', 'title': 'Status', 'orderable': True},
-        {'name': 'created_at', 'title': 'Created', 'orderable': True},
-    ]
-
     context = {
         'table_title': 'FastMon Files (Time Frames)',
         'table_description': 'Track Time Frame (TF) files sampled from Super Time Frames for fast monitoring.',
         'ajax_url': reverse('monitor_app:fastmon_files_datatable_ajax'),
-        'columns': columns,
-        'statuses': statuses,
+        'columns': _LIST_COLUMNS,
+        'statuses': _STATUSES,
         'selected_stf_filename': stf_filename,
         'selected_status': status_filter,
         'selected_run_number': run_number,
@@ -52,12 +67,15 @@ def fastmon_files_datatable_ajax(request):
     AJAX endpoint for server-side DataTables processing of FastMon files.
     """
     # Initialize DataTables processor
-    columns = ['tf_filename', 'stf_file__stf_filename', 'stf_file__run__run_number',
-               'file_size_bytes', 'status', 'created_at']
-    dt = DataTablesProcessor(request, columns, default_order_column=5, default_order_direction='desc')
+    dt = DataTablesProcessor(request, _ORDER_COLUMNS, default_order_column=5, default_order_direction='desc')
 
-    # Build base queryset with related data
-    queryset = FastMonFile.objects.select_related('stf_file', 'stf_file__run')
+    # Build base queryset with related data, loading only the columns the
+    # table renders (FastMonFile and StfFile both carry JSON metadata).
+    queryset = (FastMonFile.objects
+                .select_related('stf_file', 'stf_file__run')
+                .only('tf_filename', 'file_size_bytes', 'status', 'created_at',
+                      'stf_file__file_id', 'stf_file__stf_filename',
+                      'stf_file__run__run_number'))
 
     # Apply filters using utility
     filter_mapping = {
@@ -71,50 +89,65 @@ def fastmon_files_datatable_ajax(request):
         if filters[param_name]:
             queryset = queryset.filter(**{field_name: filters[param_name]})
 
-    # Get counts and apply search/pagination
-    records_total = FastMonFile.objects.count()
-    search_fields = ['tf_filename', 'stf_file__stf_filename', 'stf_file__run__run_number']
-    queryset = dt.apply_search(queryset, search_fields)
-    records_filtered = queryset.count()
+    # Get counts and apply search/pagination. The unfiltered total is a
+    # full-table COUNT run on every DataTables draw, so it is served as a
+    # cached product; the rows themselves stay live.
+    product = get_product('fastmon_files_total', FastMonFile.objects.count,
+                          ttl_seconds=30,
+                          refresh=request.GET.get('refresh') == '1')
+    records_total = product['value']
+    if records_total is None:
+        records_total = FastMonFile.objects.count()
+    product_extra = {
+        'product_built_at': (product['built_at'].isoformat()
+                             if product['built_at'] else None),
+        'product_age_seconds': product['age_seconds'],
+        'product_refreshing': product['refreshing'],
+    }
+    # Substring search covers the text columns only; an icontains on the
+    # integer run number casts every joined row. A numeric search term
+    # matches the run number exactly, which the index serves (bounded to
+    # stay within the integer column's range). isdecimal(), not isdigit():
+    # superscripts and the like are digits that int() rejects.
+    if dt.search_value:
+        search_q = (Q(tf_filename__icontains=dt.search_value)
+                    | Q(stf_file__stf_filename__icontains=dt.search_value))
+        if dt.search_value.isdecimal() and len(dt.search_value) < 10:
+            search_q |= Q(stf_file__run__run_number=int(dt.search_value))
+        queryset = queryset.filter(search_q)
+    if dt.search_value or any(filters.values()):
+        records_filtered = queryset.count()
+    else:
+        records_filtered = records_total
 
     # Apply ordering and pagination
     queryset = queryset.order_by(dt.get_order_by())
     fastmon_files = dt.apply_pagination(queryset)
 
-    # Format data for DataTables
-    from django.urls import reverse
-
+    # Format data for DataTables. Detail URLs are built from per-request
+    # prefixes rather than a reverse() per row.
     from .cell_fmt import fill_cell, short_filename
-    data = []
-    for file in fastmon_files:
-        # Use plain text status (consistent with STF files view)
-        status_text = file.get_status_display()
-
-        # Format file size with commas for readability
-        file_size = f"{file.file_size_bytes:,}" if file.file_size_bytes else "N/A"
-
-        # Make STF filename clickable to go to STF detail page
-        stf_detail_url = reverse('monitor_app:stf_file_detail', args=[file.stf_file.file_id])
-        stf_link = (f'<a href="{stf_detail_url}">'
-                    f'{short_filename(file.stf_file.stf_filename)}</a>')
-
-        # Make run number clickable to go to run detail page
-        run_detail_url = reverse('monitor_app:run_detail', args=[file.stf_file.run.run_number])
-        run_link = f'<a href="{run_detail_url}">{file.stf_file.run.run_number}</a>'
-
-        data.append([
-            short_filename(file.tf_filename),
-            stf_link,
-            run_link,
-            file_size,
-            fill_cell(status_text, file.status),
-            format_datetime(file.created_at)
-        ])
+    stf_detail_prefix = _url_prefix('monitor_app:stf_file_detail', uuid.UUID(int=0))
+    run_detail_prefix = _url_prefix('monitor_app:run_detail', 0)
+    # Rows are formatted as the response streams, straight off a queryset
+    # iterator, so a large page is never materialized as a list.
+    def rows():
+        for file in fastmon_files.iterator(chunk_size=dt.STREAM_BLOCK_ROWS):
+            stf_file = file.stf_file
+            run_number = stf_file.run.run_number
+            yield [
+                short_filename(file.tf_filename),
+                # STF filename links to the STF detail page
+                _LINK(stf_detail_prefix, stf_file.file_id, short_filename(stf_file.stf_filename)),
+                # Run number links to the run detail page
+                _LINK(run_detail_prefix, run_number, run_number),
+                # File size with commas for readability
+                _THOUSANDS(file.file_size_bytes) if file.file_size_bytes else "N/A",
+                # Plain text status (consistent with STF files view)
+                fill_cell(file.get_status_display(), file.status),
+                format_datetime(file.created_at)
+            ]
 
     # Return DataTables-formatted response
-    return JsonResponse({
-        'draw': dt.draw,
-        'recordsTotal': records_total,
-        'recordsFiltered': records_filtered,
-        'data': data
-    })
\ No newline at end of file
+    return dt.create_response(rows(), records_total, records_filtered,
+                              extra=product_extra)
\ No newline at end of file
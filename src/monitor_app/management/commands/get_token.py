@@ -13,6 +13,12 @@ class Command(BaseCommand):
         username = options['username']
         create_user = options['create_user']
         
+        # Common case: the user already has a token — one joined query.
+        token = Token.objects.select_related('user').filter(user__username=username).first()
+        if token:
+            self.stdout.write(self.style.SUCCESS(f'Token for user "{username}" is: {token.key}'))
+            return
+
         try:
             user = User.objects.get(username=username)
         except User.DoesNotExist:
@@ -27,4 +33,4 @@ class Command(BaseCommand):
         if created:
             self.stdout.write(self.style.SUCCESS(f'New token created for user "{username}": {token.key}'))
         else:
-            self.stdout.write(self.style.SUCCESS(f'Token for user "{username}" is: {token.key}'))
+            self.stdout.write(self.style.SUCCESS(f'Token for user "{username}" is: {token.key}'))
\ No newline at end of file
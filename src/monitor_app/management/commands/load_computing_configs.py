@@ -2,14 +2,37 @@
 Management command to load PanDA queue and Rucio endpoint configurations from JSON files.
 """
 
+import hashlib
 import json
 import os
+import sys
 from pathlib import Path
 from django.core.management.base import BaseCommand
 from django.conf import settings
+from django.db import connection, transaction
 from monitor_app.models import PandaQueue, RucioEndpoint
 
 
+# endpoint_type by (is_tape, is_cache); tape wins over cache.
+_ENDPOINT_TYPES = {
+    (False, False): 'disk',
+    (False, True): 'cache',
+    (True, False): 'tape',
+    (True, True): 'tape',
+}
+
+
+def _load_json(file_path):
+    """Parse a JSON config file."""
+    return json.loads(Path(file_path).read_bytes())
+
+
+def _config_hash(config):
+    """Stable digest of one config entry (key order does not matter)."""
+    canonical = json.dumps(config, sort_keys=True, separators=(',', ':'))
+    return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+
 class Command(BaseCommand):
     help = 'Load PanDA queue and Rucio endpoint configurations from JSON files'
 
@@ -36,141 +59,200 @@ class Command(BaseCommand):
             testbed_root = Path(settings.BASE_DIR).parent.parent / 'swf-testbed'
             config_dir = testbed_root / 'config'
             
-            if not config_dir.exists():
+            if not config_dir.is_dir():
                 # Try alternate path
                 config_dir = Path('/direct/eic+u/wenauseic/github/swf-testbed/config')
         
-        if not config_dir.exists():
+        if not config_dir.is_dir():
             self.stdout.write(self.style.ERROR(f'Config directory not found: {config_dir}'))
             return
+
+        # One directory read instead of a stat per expected file; the
+        # config dir is typically on a network filesystem. Read before the
+        # transaction so an unreadable directory is reported, not raised
+        # from inside it.
+        try:
+            present = {entry.name for entry in os.scandir(config_dir)}
+        except OSError as e:
+            self.stdout.write(self.style.ERROR(f'Cannot read config directory {config_dir}: {e}'))
+            return
         
         self.stdout.write(f'Loading configurations from: {config_dir}')
         
-        # Clear existing data if requested
-        if options['clear']:
-            self.stdout.write('Clearing existing data...')
-            for queue in PandaQueue.objects.all():
-                if (queue.metadata or {}).get('ai_content_ids'):
-                    continue
-                queue.delete()
-            RucioEndpoint.objects.all().delete()
-            self.stdout.write(self.style.SUCCESS('Existing data cleared'))
-        
-        # Load PanDA queues
-        panda_file = config_dir / 'panda_queues.json'
-        if panda_file.exists():
-            self.load_panda_queues(panda_file)
-        else:
-            self.stdout.write(self.style.WARNING(f'PanDA queues file not found: {panda_file}'))
-        
-        # Load Rucio endpoints
-        rucio_file = config_dir / 'ddm_endpoints.json'
-        if rucio_file.exists():
-            self.load_rucio_endpoints(rucio_file)
-        else:
-            self.stdout.write(self.style.WARNING(f'Rucio endpoints file not found: {rucio_file}'))
+        # Clear and reload as one transaction: a single commit, and a
+        # --clear whose reload fails rolls back instead of leaving the
+        # tables empty.
+        with transaction.atomic():
+            if connection.vendor == 'postgresql':
+                # The tables are rebuilt from the JSON files on every run, so
+                # this one commit need not wait for the WAL flush.
+                with connection.cursor() as cursor:
+                    cursor.execute('SET LOCAL synchronous_commit = OFF')
+
+            # Clear existing data if requested
+            if options['clear']:
+                self.stdout.write('Clearing existing data...')
+                # Queues carrying AI content links are kept. Everything else
+                # goes in one DELETE per table — nothing references these
+                # rows and no delete signals are registered, so Django issues
+                # a single statement rather than one per instance.
+                keep = [
+                    queue_name for queue_name, metadata
+                    in PandaQueue.objects.values_list('queue_name', 'metadata')
+                    if (metadata or {}).get('ai_content_ids')
+                ]
+                PandaQueue.objects.exclude(queue_name__in=keep).delete()
+                RucioEndpoint.objects.all().delete()
+                self.stdout.write(self.style.SUCCESS('Existing data cleared'))
+            
+            loaded = True
+            
+            # Load PanDA queues
+            panda_file = config_dir / 'panda_queues.json'
+            if panda_file.name in present:
+                loaded &= self.load_panda_queues(panda_file)
+            else:
+                self.stdout.write(self.style.WARNING(f'PanDA queues file not found: {panda_file}'))
+            
+            # Load Rucio endpoints
+            rucio_file = config_dir / 'ddm_endpoints.json'
+            if rucio_file.name in present:
+                loaded &= self.load_rucio_endpoints(rucio_file)
+            else:
+                self.stdout.write(self.style.WARNING(f'Rucio endpoints file not found: {rucio_file}'))
+            
+            if options['clear'] and not loaded:
+                transaction.set_rollback(True)
+                self.stdout.write(self.style.ERROR('Load failed; clear rolled back, existing data kept'))
+                return
         
         self.stdout.write(self.style.SUCCESS('Configuration loading complete'))
 
     def load_panda_queues(self, file_path):
-        """Load PanDA queue configurations from JSON file."""
+        """Load PanDA queue configurations from JSON file; True on success."""
         self.stdout.write(f'Loading PanDA queues from {file_path}...')
         
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-            
-            created_count = 0
-            updated_count = 0
+            data = _load_json(file_path)
             
+            # Entries whose config digest matches the stored one are skipped;
+            # a typical reload changes few queues.
+            existing = dict(PandaQueue.objects.values_list('queue_name', 'config_hash'))
+            queues = []
+            unchanged_count = 0
             for queue_name, config in data.items():
-                # Extract key fields from config
-                site = config.get('site', '')
-                queue_type = config.get('type', '')
+                config_hash = _config_hash(config)
+                if existing.get(queue_name) == config_hash:
+                    unchanged_count += 1
+                    continue
+
+                # Extract key fields from config. Sites and types repeat
+                # across thousands of queues; interning lets the pending
+                # instances share one string per distinct value.
+                site = sys.intern(str(config.get('site') or ''))
+                queue_type = sys.intern(str(config.get('type') or ''))
                 
                 # Determine status based on config
                 status = 'active'  # Default to active
                 if config.get('status') == 'offline':
                     status = 'offline'
                 
-                # Create or update queue
-                queue, created = PandaQueue.objects.update_or_create(
+                queues.append(PandaQueue(
                     queue_name=queue_name,
-                    defaults={
-                        'site': site,
-                        'queue_type': queue_type,
-                        'status': status,
-                        'config_data': config,
-                    }
+                    site=site,
+                    queue_type=queue_type,
+                    status=status,
+                    config_data=config,
+                    config_hash=config_hash,
+                ))
+            
+            # One upsert for the whole file instead of a SELECT plus
+            # INSERT/UPDATE per queue. metadata is not in update_fields, so
+            # annotations on existing queues survive a reload.
+            with transaction.atomic():
+                PandaQueue.objects.bulk_create(
+                    queues,
+                    batch_size=1000,
+                    update_conflicts=True,
+                    unique_fields=['queue_name'],
+                    update_fields=['site', 'queue_type', 'status', 'config_data',
+                                   'config_hash', 'updated_at'],
                 )
-                
-                if created:
-                    created_count += 1
-                else:
-                    updated_count += 1
+            updated_count = sum(1 for q in queues if q.queue_name in existing)
+            created_count = len(queues) - updated_count
             
             self.stdout.write(
                 self.style.SUCCESS(
-                    f'PanDA queues: {created_count} created, {updated_count} updated'
+                    f'PanDA queues: {created_count} created, {updated_count} updated, '
+                    f'{unchanged_count} unchanged'
                 )
             )
+            return True
             
         except Exception as e:
             self.stdout.write(
                 self.style.ERROR(f'Error loading PanDA queues: {str(e)}')
             )
+            return False
 
     def load_rucio_endpoints(self, file_path):
-        """Load Rucio endpoint configurations from JSON file."""
+        """Load Rucio endpoint configurations from JSON file; True on success."""
         self.stdout.write(f'Loading Rucio endpoints from {file_path}...')
         
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-            
-            created_count = 0
-            updated_count = 0
+            data = _load_json(file_path)
             
+            existing = dict(RucioEndpoint.objects.values_list('endpoint_name', 'config_hash'))
+            endpoints = []
+            unchanged_count = 0
             for endpoint_name, config in data.items():
+                config_hash = _config_hash(config)
+                if existing.get(endpoint_name) == config_hash:
+                    unchanged_count += 1
+                    continue
+
                 # Extract key fields from config
-                site = config.get('rcsite', config.get('site', ''))
-                is_tape = config.get('is_tape', False)
+                site = sys.intern(str(config.get('rcsite') or config.get('site') or ''))
+                is_tape = bool(config.get('is_tape'))
                 
-                # Determine endpoint type
-                if is_tape:
-                    endpoint_type = 'tape'
-                elif config.get('is_cache'):
-                    endpoint_type = 'cache'
-                else:
-                    endpoint_type = 'disk'
+                endpoint_type = _ENDPOINT_TYPES[is_tape, bool(config.get('is_cache'))]
                 
                 # Check if active based on rc_site_state
                 is_active = config.get('rc_site_state') == 'ACTIVE'
                 
-                # Create or update endpoint
-                endpoint, created = RucioEndpoint.objects.update_or_create(
+                endpoints.append(RucioEndpoint(
                     endpoint_name=endpoint_name,
-                    defaults={
-                        'site': site,
-                        'endpoint_type': endpoint_type,
-                        'is_tape': is_tape,
-                        'is_active': is_active,
-                        'config_data': config,
-                    }
+                    site=site,
+                    endpoint_type=endpoint_type,
+                    is_tape=is_tape,
+                    is_active=is_active,
+                    config_data=config,
+                    config_hash=config_hash,
+                ))
+            
+            # One upsert for the whole file, as for the PanDA queues
+            with transaction.atomic():
+                RucioEndpoint.objects.bulk_create(
+                    endpoints,
+                    batch_size=1000,
+                    update_conflicts=True,
+                    unique_fields=['endpoint_name'],
+                    update_fields=['site', 'endpoint_type', 'is_tape', 'is_active',
+                                   'config_data', 'config_hash', 'updated_at'],
                 )
-                
-                if created:
-                    created_count += 1
-                else:
-                    updated_count += 1
+            updated_count = sum(1 for e in endpoints if e.endpoint_name in existing)
+            created_count = len(endpoints) - updated_count
             
             self.stdout.write(
                 self.style.SUCCESS(
-                    f'Rucio endpoints: {created_count} created, {updated_count} updated'
+                    f'Rucio endpoints: {created_count} created, {updated_count} updated, '
+                    f'{unchanged_count} unchanged'
                 )
             )
+            return True
             
         except Exception as e:
             self.stdout.write(
                 self.style.ERROR(f'Error loading Rucio endpoints: {str(e)}')
             )
+            return False
@@ -20,7 +20,8 @@ Run: manage.py publish_epicprod_live   (systemd unit swf-epicprod-live)
 """
 import logging
 import os
-import time
+import signal
+import threading
 from datetime import timezone as dt_timezone
 
 import requests
@@ -73,13 +74,20 @@ class Command(BaseCommand):
         self.channel_id = ''
         self._init_high_water()
         logger.info("epicprod-live publisher started (team %s)", MM_TEAM)
-        while True:
+        # SIGTERM (systemd stop) and SIGINT end the wait between cycles
+        # at once; a cycle in progress finishes its posts and high-water
+        # advance first, so a stop never double-posts on restart.
+        self._stop = threading.Event()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, lambda *_: self._stop.set())
+        while not self._stop.is_set():
             poll = DEFAULT_POLL_SECONDS
             try:
                 poll = self._cycle()
             except Exception:
                 logger.exception("publish cycle failed; continuing")
-            time.sleep(max(int(poll), 5))
+            self._stop.wait(max(int(poll), 5))
+        logger.info("epicprod-live publisher stopped")
 
     # -- one cycle -----------------------------------------------------------
 
@@ -6,6 +6,7 @@ Requires SWF_TESTUSER_PASSWORD environment variable to be set.
 import os
 from django.core.management.base import BaseCommand, CommandError
 from django.contrib.auth.models import User
+from django.db import transaction
 
 
 class Command(BaseCommand):
@@ -32,23 +33,23 @@ class Command(BaseCommand):
                 'Example: export SWF_TESTUSER_PASSWORD="your_secure_password"'
             )
         
-        try:
-            # Try to get existing user
-            user = User.objects.get(username=username)
-            user.set_password(password)
-            user.save()
+        # Lookup and write in one transaction, so the account never exists
+        # without its password.
+        with transaction.atomic():
+            user = User.objects.select_for_update().filter(username=username).first()
+            created = user is None
+            if created:
+                User.objects.create_user(username, 'testuser@example.com', password)
+            else:
+                user.set_password(password)
+                user.save(update_fields=['password'])
+        if created:
             self.stdout.write(
-                self.style.SUCCESS(f'Updated password for existing user "{username}"')
-            )
-        except User.DoesNotExist:
-            # Create new user
-            user = User.objects.create_user(
-                username=username,
-                password=password,
-                email='testuser@example.com'
+                self.style.SUCCESS(f'Created new user "{username}"')
             )
+        else:
             self.stdout.write(
-                self.style.SUCCESS(f'Created new user "{username}"')
+                self.style.SUCCESS(f'Updated password for existing user "{username}"')
             )
         
         self.stdout.write(f'Username: {username}')
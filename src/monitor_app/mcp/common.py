@@ -72,6 +72,36 @@ def _get_testbed_config_path() -> tuple:
         return Path(swf_home) / 'swf-testbed' / 'workflows' / 'testbed.toml', 'default'
 
 
+# (key, data) for the last testbed.toml parsed, key being (path, mtime_ns).
+# Swapped as one tuple so concurrent readers never see a mismatched pair.
+_testbed_toml_cache = (None, None)
+
+
+def _load_testbed_toml(path):
+    """
+    Parse a testbed.toml, reusing the last result while the file is unchanged.
+
+    Returns:
+        dict of the parsed TOML, or None if the file does not exist.
+        Parse errors propagate to the caller. The returned dict is shared;
+        callers must not modify it.
+    """
+    global _testbed_toml_cache
+    try:
+        key = (str(path), path.stat().st_mtime_ns)
+    except OSError:
+        return None
+    cached_key, data = _testbed_toml_cache
+    if cached_key == key:
+        return data
+
+    import tomllib
+    with open(path, 'rb') as f:
+        data = tomllib.load(f)
+    _testbed_toml_cache = (key, data)
+    return data
+
+
 # -----------------------------------------------------------------------------
 # Tool Discovery
 # -----------------------------------------------------------------------------
@@ -82,317 +112,319 @@ def _get_testbed_config_path() -> tuple:
 # docs/MCP_TOOL_REFERENCE.md.
 # -----------------------------------------------------------------------------
 
+_AVAILABLE_TOOLS = (
+    {
+        "name": "swf_list_available_tools",
+        "description": "List all available MCP tools with descriptions",
+        "parameters": [],
+    },
+    {
+        "name": "get_server_instructions",
+        "description": "Get the swf-monitor MCP server instructions. Compatibility tool for clients and permissions lists that previously used django-mcp-server's server-instruction helper.",
+        "parameters": [],
+    },
+    {
+        "name": "swf_get_system_state",
+        "description": "Get comprehensive system state: user context, agent manager, workflow runner, readiness, agents, executions",
+        "parameters": ["username"],
+    },
+    {
+        "name": "swf_list_agents",
+        "description": "List registered agents. Excludes EXITED agents by default. Use status='EXITED' to see exited, status='all' to see all.",
+        "parameters": ["namespace", "agent_type", "status", "execution_id", "start_time", "end_time"],
+    },
+    {
+        "name": "swf_get_agent",
+        "description": "Get detailed information about a specific agent",
+        "parameters": ["name"],
+    },
+    {
+        "name": "swf_list_namespaces",
+        "description": "List all testbed namespaces (isolation boundaries for users)",
+        "parameters": [],
+    },
+    {
+        "name": "swf_get_namespace",
+        "description": "Get namespace details including activity counts",
+        "parameters": ["namespace", "start_time", "end_time"],
+    },
+    {
+        "name": "swf_list_workflow_definitions",
+        "description": "List available workflow definitions that can be executed",
+        "parameters": ["workflow_type", "created_by", "limit", "offset"],
+    },
+    {
+        "name": "swf_list_workflow_executions",
+        "description": "List workflow executions. Use currently_running=True to see what's running now",
+        "parameters": ["namespace", "status", "executed_by", "workflow_name", "currently_running", "start_time", "end_time"],
+    },
+    {
+        "name": "swf_get_workflow_execution",
+        "description": "Get detailed information about a specific workflow execution",
+        "parameters": ["execution_id"],
+    },
+    {
+        "name": "swf_list_messages",
+        "description": "List workflow messages between agents for debugging",
+        "parameters": ["namespace", "execution_id", "agent", "message_type", "start_time", "end_time"],
+    },
+    {
+        "name": "swf_list_runs",
+        "description": "List simulation runs with timing and STF file counts",
+        "parameters": ["start_time", "end_time"],
+    },
+    {
+        "name": "swf_get_run",
+        "description": "Get detailed information about a specific run",
+        "parameters": ["run_number"],
+    },
+    {
+        "name": "swf_list_stf_files",
+        "description": "List STF (Super Time Frame) files with filtering",
+        "parameters": ["run_number", "status", "machine_state", "start_time", "end_time"],
+    },
+    {
+        "name": "swf_get_stf_file",
+        "description": "Get detailed information about a specific STF file",
+        "parameters": ["file_id", "stf_filename"],
+    },
+    {
+        "name": "swf_list_tf_slices",
+        "description": "List TF slices for fast processing workflow",
+        "parameters": ["run_number", "stf_filename", "tf_filename", "status", "assigned_worker", "start_time", "end_time"],
+    },
+    {
+        "name": "swf_get_tf_slice",
+        "description": "Get detailed information about a specific TF slice",
+        "parameters": ["tf_filename", "slice_id"],
+    },
+    {
+        "name": "swf_list_logs",
+        "description": "List application log entries. Use level='ERROR' to find errors",
+        "parameters": ["app_name", "instance_name", "execution_id", "level", "search", "start_time", "end_time"],
+    },
+    {
+        "name": "swf_get_log_entry",
+        "description": "Get full details of a specific log entry",
+        "parameters": ["log_id"],
+    },
+    {
+        "name": "swf_start_workflow",
+        "description": "Start a workflow by sending command to DAQ Simulator agent",
+        "parameters": ["workflow_name", "namespace", "config", "realtime", "duration",
+                      "stf_count", "physics_period_count", "physics_period_duration", "stf_interval"],
+    },
+    {
+        "name": "swf_stop_workflow",
+        "description": "Stop a running workflow by sending stop command to agent",
+        "parameters": ["execution_id"],
+    },
+    {
+        "name": "swf_end_execution",
+        "description": "Mark a workflow execution as terminated in database (no agent message)",
+        "parameters": ["execution_id"],
+    },
+    {
+        "name": "swf_kill_agent",
+        "description": "Kill an agent process by sending SIGKILL to its PID. Sets status to EXITED.",
+        "parameters": ["name"],
+    },
+    {
+        "name": "swf_check_agent_manager",
+        "description": "Check if user's agent manager daemon is alive (has recent heartbeat)",
+        "parameters": ["username"],
+    },
+    {
+        "name": "swf_start_user_testbed",
+        "description": "Start user's testbed via their agent manager daemon",
+        "parameters": ["username", "config_name"],
+    },
+    {
+        "name": "swf_stop_user_testbed",
+        "description": "Stop user's testbed via their agent manager daemon",
+        "parameters": ["username"],
+    },
+    {
+        "name": "swf_get_testbed_status",
+        "description": "Get comprehensive testbed status: agent manager, namespace, workflow agents",
+        "parameters": ["username"],
+    },
+    {
+        "name": "swf_get_workflow_monitor",
+        "description": "Get status and events for a workflow execution (aggregates messages/logs)",
+        "parameters": ["execution_id"],
+    },
+    {
+        "name": "swf_list_workflow_monitors",
+        "description": "List recent workflow executions that can be monitored",
+        "parameters": [],
+    },
+    {
+        "name": "swf_send_message",
+        "description": "Send a message to the monitoring stream (for testing, announcements, etc.)",
+        "parameters": ["message", "message_type", "metadata"],
+    },
+    {
+        "name": "swf_record_ai_memory",
+        "description": "Record a dialogue exchange for AI memory persistence",
+        "parameters": ["username", "session_id", "role", "content", "namespace", "project_path"],
+    },
+    {
+        "name": "swf_get_ai_memory",
+        "description": "Get recent dialogue history for session context",
+        "parameters": ["username", "turns", "namespace"],
+    },
+    {
+        "name": "epic_register_ai_assessment",
+        "description": "Register append-only AI assessment content as a corun-ai Page for an epicprod object and link it from the target object's JSON corun_page_group_ids when it is a known local subject.",
+        "parameters": ["subject_type", "subject_key", "assessment", "username", "ai", "subject_label", "subject_url", "data"],
+    },
+    {
+        "name": "epic_get_ai_content",
+        "description": "Retrieve append-only epicprod AI assessment content by corun-ai Page group ids and/or legacy AIContent ids. Use the arguments provided in a detail payload's ai_content.retrieval.arguments.",
+        "parameters": ["ids", "corun_page_group_ids"],
+    },
+    {
+        "name": "epicprod_campaign_status",
+        "description": "Production campaign evidence rollup: progress, PanDA health, arrivals, dispositions, action activity, infrastructure state, exact reporting window, and mechanical assessment floor.",
+        "parameters": ["campaign", "window_days", "targets_only"],
+    },
+    {
+        "name": "ai_list_proposals",
+        "description": "List AI proposals awaiting human decision (default) or by status. Show the returned display text to the human verbatim; each line starts with the proposal ref (e.g. cp-12).",
+        "parameters": ["status", "limit"],
+    },
+    {
+        "name": "ai_decide_proposal",
+        "description": "Relay one human's approve/deny on one AI proposal by ref. Only after an explicit human instruction naming the ref; username is the deciding human, who must be on the SysConfig approver list.",
+        "parameters": ["ref", "decision", "username", "quality"],
+    },
+    {
+        "name": "epicprod_list_actions",
+        "description": "Query the epicprod action stream: structured records of production actions (sweeps, submissions, assessments) with who/what/outcome/duration. summarize=True gives counts and duration stats — prefer it for reporting.",
+        "parameters": ["action", "instance", "subject_type", "subject_key", "username", "outcome", "start_time", "end_time", "summarize", "limit", "offset"],
+    },
+    # PanDA Monitor tools
+    {
+        "name": "panda_list_jobs",
+        "description": "List PanDA jobs from ePIC production DB with summary stats. Cursor-based pagination via before_id.",
+        "parameters": ["days", "status", "username", "site", "taskid", "reqid", "limit", "before_id"],
+    },
+    {
+        "name": "panda_diagnose_jobs",
+        "description": "Diagnose failed/faulty PanDA jobs with full error details (7 error components). Cursor-based pagination via before_id.",
+        "parameters": ["days", "username", "site", "taskid", "reqid", "error_component", "limit", "before_id"],
+    },
+    {
+        "name": "panda_list_tasks",
+        "description": "List JEDI tasks from ePIC production DB with summary stats. Tasks are higher-level than jobs. Cursor-based pagination via before_id.",
+        "parameters": ["days", "status", "username", "taskname", "reqid", "workinggroup", "taskid", "processingtype", "limit", "before_id"],
+    },
+    {
+        "name": "panda_error_summary",
+        "description": "Aggregate error summary across failed PanDA jobs, ranked by frequency. Shows task/site distributions and representative PandaIDs for evidence-based causal drill-down.",
+        "parameters": ["days", "username", "site", "taskid", "error_source", "limit"],
+    },
+    {
+        "name": "panda_get_activity",
+        "description": "Pre-digested PanDA activity overview — aggregate counts only, no individual records. Use first to answer 'What is PanDA doing?'",
+        "parameters": ["days", "username", "site", "workinggroup"],
+    },
+    {
+        "name": "panda_list_queues",
+        "description": "List PanDA compute queues with configuration summary. Filter by VO (e.g. 'eic'), status, state, or name search.",
+        "parameters": ["vo", "status", "state", "search"],
+    },
+    {
+        "name": "panda_get_queue",
+        "description": "Full configuration for a single PanDA queue — container options, storage, CE endpoints, resource limits.",
+        "parameters": ["panda_queue"],
+    },
+    {
+        "name": "panda_resource_usage",
+        "description": "Aggregate core-hours for finished jobs — allocated (cores × wall time) vs used (actual CPU), with site/user breakdowns and optional daily or weekly site series.",
+        "parameters": ["days", "site", "username", "taskid", "start_time", "end_time", "bucket"],
+    },
+    {
+        "name": "panda_study_job",
+        "description": "Deep study of a single PanDA job — full record, files, errors, log URLs, harvester info, parent task context, and parsed ePIC production diagnosis.",
+        "parameters": ["pandaid"],
+    },
+    {
+        "name": "panda_harvester_workers",
+        "description": "Live Harvester pilot/worker counts across EIC queues — running, submitted, finished by site.",
+        "parameters": ["site", "hours"],
+    },
+    # PCS (Physics Configuration System) tools
+    {
+        "name": "pcs_list_tags",
+        "description": "List PCS (Physics Configuration System) tags — production task configurations for MC campaigns. Filter by type (p/e/s/r/k), category, status, creator, or text.",
+        "parameters": ["tag_type", "category", "status", "creator", "search", "limit"],
+    },
+    {
+        "name": "pcs_get_tag",
+        "description": "Get full details of a single PCS tag by label (e.g. 'p1001', 'e3', 'r1', 'k1').",
+        "parameters": ["tag_label"],
+    },
+    {
+        "name": "pcs_search_tags",
+        "description": "Search PCS tags by keyword in label, description, or parameter values (e.g. 'photoproduction', 'eAu', 'pythia8').",
+        "parameters": ["query", "tag_type", "limit"],
+    },
+    # PCS — datasets and prod tasks
+    {
+        "name": "pcs_dataset_list",
+        "description": "List PCS Datasets with optional filters: stage (e.g. 'evgen'), source_kind ('csv_manifest'), exact source_location, scope, name_contains. name_contains matches composed_name and legacy dataset_name.",
+        "parameters": ["stage", "source_kind", "source_location", "scope", "name_contains", "limit", "offset"],
+    },
+    {
+        "name": "pcs_dataset_get",
+        "description": "Get full details of a single Dataset by composed tag name, DID, or legacy dataset_name. Prefer name=composed_name.",
+        "parameters": ["name", "did", "dataset_name"],
+    },
+    {
+        "name": "pcs_dataset_intake",
+        "description": "Idempotent intake of an external (e.g. EVGEN CSV manifest) Dataset. Idempotent on (source_kind, source_location). Creates a Dataset(stage=evgen, source.{kind,location}=...) when no match exists.",
+        "parameters": ["source_location", "source_kind", "physics_tag", "evgen_tag", "simu_tag", "reco_tag", "detector_version", "detector_config", "scope", "stage", "description", "created_by"],
+    },
+    {
+        "name": "pcs_prodtask_list",
+        "description": "List PCS ProdTasks with optional filters: lifecycle status (draft/ready/submitted/completed/failed), public_catalog_issue, name_contains.",
+        "parameters": ["status", "public_catalog_issue", "name_contains", "limit", "offset"],
+    },
+    {
+        "name": "pcs_prodtask_get",
+        "description": "Get full details of a single ProdTask by name, including derived input/output/intermediate dataset DID lists and input_source_{kind,location,stage}.",
+        "parameters": ["name"],
+    },
+    {
+        "name": "pcs_prodtask_artifact",
+        "description": "Regenerate a ProdTask submission artifact from current PCS state. fmt = condor | panda | jedi | evgen | dump. evgen is the live prod-ops submission spec.",
+        "parameters": ["name", "fmt"],
+    },
+    {
+        "name": "pcs_prodtask_intake",
+        "description": "Idempotent intake of a draft ProdTask. Idempotency key: public_catalog_issue OR (public_catalog_csv_path, public_catalog_row_key). Updates existing on match; creates draft requiring name/dataset/prod_config; dataset accepts composed_name, DID, or legacy dataset_name.",
+        "parameters": ["public_catalog_issue", "public_catalog_csv_path", "public_catalog_row_key", "name", "dataset", "prod_config", "description", "input_dataset_did", "public_catalog_repo", "public_catalog_pr", "public_catalog_row_index", "public_catalog_page_url", "public_catalog_commit_sha", "created_by"],
+    },
+    {
+        "name": "pcs_prodtask_link_input",
+        "description": "Link input Dataset(s) to a ProdTask via overrides JSON. task_name accepts composed_name, legacy name, or pk. Provide one of did or dids; linked Datasets must already exist.",
+        "parameters": ["task_name", "did", "dids"],
+    },
+    {
+        "name": "pcs_prodtask_set_status",
+        "description": "Transition a ProdTask to a new lifecycle state. Allowed: draft->ready, ready->{draft,submitted}, submitted->{completed,failed}. Submission itself is not exposed via MCP — operators run pcs-task-cmd --submit locally.",
+        "parameters": ["task_name", "status"],
+    },
+)
+
+
 def get_available_tools_list() -> list:
     """
     Return the hardcoded list of all available MCP tools.
     Called by swf_list_available_tools in __init__.py.
     """
-    tools = [
-        {
-            "name": "swf_list_available_tools",
-            "description": "List all available MCP tools with descriptions",
-            "parameters": [],
-        },
-        {
-            "name": "get_server_instructions",
-            "description": "Get the swf-monitor MCP server instructions. Compatibility tool for clients and permissions lists that previously used django-mcp-server's server-instruction helper.",
-            "parameters": [],
-        },
-        {
-            "name": "swf_get_system_state",
-            "description": "Get comprehensive system state: user context, agent manager, workflow runner, readiness, agents, executions",
-            "parameters": ["username"],
-        },
-        {
-            "name": "swf_list_agents",
-            "description": "List registered agents. Excludes EXITED agents by default. Use status='EXITED' to see exited, status='all' to see all.",
-            "parameters": ["namespace", "agent_type", "status", "execution_id", "start_time", "end_time"],
-        },
-        {
-            "name": "swf_get_agent",
-            "description": "Get detailed information about a specific agent",
-            "parameters": ["name"],
-        },
-        {
-            "name": "swf_list_namespaces",
-            "description": "List all testbed namespaces (isolation boundaries for users)",
-            "parameters": [],
-        },
-        {
-            "name": "swf_get_namespace",
-            "description": "Get namespace details including activity counts",
-            "parameters": ["namespace", "start_time", "end_time"],
-        },
-        {
-            "name": "swf_list_workflow_definitions",
-            "description": "List available workflow definitions that can be executed",
-            "parameters": ["workflow_type", "created_by"],
-        },
-        {
-            "name": "swf_list_workflow_executions",
-            "description": "List workflow executions. Use currently_running=True to see what's running now",
-            "parameters": ["namespace", "status", "executed_by", "workflow_name", "currently_running", "start_time", "end_time"],
-        },
-        {
-            "name": "swf_get_workflow_execution",
-            "description": "Get detailed information about a specific workflow execution",
-            "parameters": ["execution_id"],
-        },
-        {
-            "name": "swf_list_messages",
-            "description": "List workflow messages between agents for debugging",
-            "parameters": ["namespace", "execution_id", "agent", "message_type", "start_time", "end_time"],
-        },
-        {
-            "name": "swf_list_runs",
-            "description": "List simulation runs with timing and STF file counts",
-            "parameters": ["start_time", "end_time"],
-        },
-        {
-            "name": "swf_get_run",
-            "description": "Get detailed information about a specific run",
-            "parameters": ["run_number"],
-        },
-        {
-            "name": "swf_list_stf_files",
-            "description": "List STF (Super Time Frame) files with filtering",
-            "parameters": ["run_number", "status", "machine_state", "start_time", "end_time"],
-        },
-        {
-            "name": "swf_get_stf_file",
-            "description": "Get detailed information about a specific STF file",
-            "parameters": ["file_id", "stf_filename"],
-        },
-        {
-            "name": "swf_list_tf_slices",
-            "description": "List TF slices for fast processing workflow",
-            "parameters": ["run_number", "stf_filename", "tf_filename", "status", "assigned_worker", "start_time", "end_time"],
-        },
-        {
-            "name": "swf_get_tf_slice",
-            "description": "Get detailed information about a specific TF slice",
-            "parameters": ["tf_filename", "slice_id"],
-        },
-        {
-            "name": "swf_list_logs",
-            "description": "List application log entries. Use level='ERROR' to find errors",
-            "parameters": ["app_name", "instance_name", "execution_id", "level", "search", "start_time", "end_time"],
-        },
-        {
-            "name": "swf_get_log_entry",
-            "description": "Get full details of a specific log entry",
-            "parameters": ["log_id"],
-        },
-        {
-            "name": "swf_start_workflow",
-            "description": "Start a workflow by sending command to DAQ Simulator agent",
-            "parameters": ["workflow_name", "namespace", "config", "realtime", "duration",
-                          "stf_count", "physics_period_count", "physics_period_duration", "stf_interval"],
-        },
-        {
-            "name": "swf_stop_workflow",
-            "description": "Stop a running workflow by sending stop command to agent",
-            "parameters": ["execution_id"],
-        },
-        {
-            "name": "swf_end_execution",
-            "description": "Mark a workflow execution as terminated in database (no agent message)",
-            "parameters": ["execution_id"],
-        },
-        {
-            "name": "swf_kill_agent",
-            "description": "Kill an agent process by sending SIGKILL to its PID. Sets status to EXITED.",
-            "parameters": ["name"],
-        },
-        {
-            "name": "swf_check_agent_manager",
-            "description": "Check if user's agent manager daemon is alive (has recent heartbeat)",
-            "parameters": ["username"],
-        },
-        {
-            "name": "swf_start_user_testbed",
-            "description": "Start user's testbed via their agent manager daemon",
-            "parameters": ["username", "config_name"],
-        },
-        {
-            "name": "swf_stop_user_testbed",
-            "description": "Stop user's testbed via their agent manager daemon",
-            "parameters": ["username"],
-        },
-        {
-            "name": "swf_get_testbed_status",
-            "description": "Get comprehensive testbed status: agent manager, namespace, workflow agents",
-            "parameters": ["username"],
-        },
-        {
-            "name": "swf_get_workflow_monitor",
-            "description": "Get status and events for a workflow execution (aggregates messages/logs)",
-            "parameters": ["execution_id"],
-        },
-        {
-            "name": "swf_list_workflow_monitors",
-            "description": "List recent workflow executions that can be monitored",
-            "parameters": [],
-        },
-        {
-            "name": "swf_send_message",
-            "description": "Send a message to the monitoring stream (for testing, announcements, etc.)",
-            "parameters": ["message", "message_type", "metadata"],
-        },
-        {
-            "name": "swf_record_ai_memory",
-            "description": "Record a dialogue exchange for AI memory persistence",
-            "parameters": ["username", "session_id", "role", "content", "namespace", "project_path"],
-        },
-        {
-            "name": "swf_get_ai_memory",
-            "description": "Get recent dialogue history for session context",
-            "parameters": ["username", "turns", "namespace"],
-        },
-        {
-            "name": "epic_register_ai_assessment",
-            "description": "Register append-only AI assessment content as a corun-ai Page for an epicprod object and link it from the target object's JSON corun_page_group_ids when it is a known local subject.",
-            "parameters": ["subject_type", "subject_key", "assessment", "username", "ai", "subject_label", "subject_url", "data"],
-        },
-        {
-            "name": "epic_get_ai_content",
-            "description": "Retrieve append-only epicprod AI assessment content by corun-ai Page group ids and/or legacy AIContent ids. Use the arguments provided in a detail payload's ai_content.retrieval.arguments.",
-            "parameters": ["ids", "corun_page_group_ids"],
-        },
-        {
-            "name": "epicprod_campaign_status",
-            "description": "Production campaign evidence rollup: progress, PanDA health, arrivals, dispositions, action activity, infrastructure state, exact reporting window, and mechanical assessment floor.",
-            "parameters": ["campaign", "window_days", "targets_only"],
-        },
-        {
-            "name": "ai_list_proposals",
-            "description": "List AI proposals awaiting human decision (default) or by status. Show the returned display text to the human verbatim; each line starts with the proposal ref (e.g. cp-12).",
-            "parameters": ["status", "limit"],
-        },
-        {
-            "name": "ai_decide_proposal",
-            "description": "Relay one human's approve/deny on one AI proposal by ref. Only after an explicit human instruction naming the ref; username is the deciding human, who must be on the SysConfig approver list.",
-            "parameters": ["ref", "decision", "username", "quality"],
-        },
-        {
-            "name": "epicprod_list_actions",
-            "description": "Query the epicprod action stream: structured records of production actions (sweeps, submissions, assessments) with who/what/outcome/duration. summarize=True gives counts and duration stats — prefer it for reporting.",
-            "parameters": ["action", "instance", "subject_type", "subject_key", "username", "outcome", "start_time", "end_time", "summarize", "limit", "offset"],
-        },
-        # PanDA Monitor tools
-        {
-            "name": "panda_list_jobs",
-            "description": "List PanDA jobs from ePIC production DB with summary stats. Cursor-based pagination via before_id.",
-            "parameters": ["days", "status", "username", "site", "taskid", "reqid", "limit", "before_id"],
-        },
-        {
-            "name": "panda_diagnose_jobs",
-            "description": "Diagnose failed/faulty PanDA jobs with full error details (7 error components). Cursor-based pagination via before_id.",
-            "parameters": ["days", "username", "site", "taskid", "reqid", "error_component", "limit", "before_id"],
-        },
-        {
-            "name": "panda_list_tasks",
-            "description": "List JEDI tasks from ePIC production DB with summary stats. Tasks are higher-level than jobs. Cursor-based pagination via before_id.",
-            "parameters": ["days", "status", "username", "taskname", "reqid", "workinggroup", "taskid", "processingtype", "limit", "before_id"],
-        },
-        {
-            "name": "panda_error_summary",
-            "description": "Aggregate error summary across failed PanDA jobs, ranked by frequency. Shows task/site distributions and representative PandaIDs for evidence-based causal drill-down.",
-            "parameters": ["days", "username", "site", "taskid", "error_source", "limit"],
-        },
-        {
-            "name": "panda_get_activity",
-            "description": "Pre-digested PanDA activity overview — aggregate counts only, no individual records. Use first to answer 'What is PanDA doing?'",
-            "parameters": ["days", "username", "site", "workinggroup"],
-        },
-        {
-            "name": "panda_list_queues",
-            "description": "List PanDA compute queues with configuration summary. Filter by VO (e.g. 'eic'), status, state, or name search.",
-            "parameters": ["vo", "status", "state", "search"],
-        },
-        {
-            "name": "panda_get_queue",
-            "description": "Full configuration for a single PanDA queue — container options, storage, CE endpoints, resource limits.",
-            "parameters": ["panda_queue"],
-        },
-        {
-            "name": "panda_resource_usage",
-            "description": "Aggregate core-hours for finished jobs — allocated (cores × wall time) vs used (actual CPU), with site/user breakdowns and optional daily or weekly site series.",
-            "parameters": ["days", "site", "username", "taskid", "start_time", "end_time", "bucket"],
-        },
-        {
-            "name": "panda_study_job",
-            "description": "Deep study of a single PanDA job — full record, files, errors, log URLs, harvester info, parent task context, and parsed ePIC production diagnosis.",
-            "parameters": ["pandaid"],
-        },
-        {
-            "name": "panda_harvester_workers",
-            "description": "Live Harvester pilot/worker counts across EIC queues — running, submitted, finished by site.",
-            "parameters": ["site", "hours"],
-        },
-        # PCS (Physics Configuration System) tools
-        {
-            "name": "pcs_list_tags",
-            "description": "List PCS (Physics Configuration System) tags — production task configurations for MC campaigns. Filter by type (p/e/s/r/k), category, status, creator, or text.",
-            "parameters": ["tag_type", "category", "status", "creator", "search", "limit"],
-        },
-        {
-            "name": "pcs_get_tag",
-            "description": "Get full details of a single PCS tag by label (e.g. 'p1001', 'e3', 'r1', 'k1').",
-            "parameters": ["tag_label"],
-        },
-        {
-            "name": "pcs_search_tags",
-            "description": "Search PCS tags by keyword in label, description, or parameter values (e.g. 'photoproduction', 'eAu', 'pythia8').",
-            "parameters": ["query", "tag_type", "limit"],
-        },
-        # PCS — datasets and prod tasks
-        {
-            "name": "pcs_dataset_list",
-            "description": "List PCS Datasets with optional filters: stage (e.g. 'evgen'), source_kind ('csv_manifest'), exact source_location, scope, name_contains. name_contains matches composed_name and legacy dataset_name.",
-            "parameters": ["stage", "source_kind", "source_location", "scope", "name_contains", "limit", "offset"],
-        },
-        {
-            "name": "pcs_dataset_get",
-            "description": "Get full details of a single Dataset by composed tag name, DID, or legacy dataset_name. Prefer name=composed_name.",
-            "parameters": ["name", "did", "dataset_name"],
-        },
-        {
-            "name": "pcs_dataset_intake",
-            "description": "Idempotent intake of an external (e.g. EVGEN CSV manifest) Dataset. Idempotent on (source_kind, source_location). Creates a Dataset(stage=evgen, source.{kind,location}=...) when no match exists.",
-            "parameters": ["source_location", "source_kind", "physics_tag", "evgen_tag", "simu_tag", "reco_tag", "detector_version", "detector_config", "scope", "stage", "description", "created_by"],
-        },
-        {
-            "name": "pcs_prodtask_list",
-            "description": "List PCS ProdTasks with optional filters: lifecycle status (draft/ready/submitted/completed/failed), public_catalog_issue, name_contains.",
-            "parameters": ["status", "public_catalog_issue", "name_contains", "limit", "offset"],
-        },
-        {
-            "name": "pcs_prodtask_get",
-            "description": "Get full details of a single ProdTask by name, including derived input/output/intermediate dataset DID lists and input_source_{kind,location,stage}.",
-            "parameters": ["name"],
-        },
-        {
-            "name": "pcs_prodtask_artifact",
-            "description": "Regenerate a ProdTask submission artifact from current PCS state. fmt = condor | panda | jedi | evgen | dump. evgen is the live prod-ops submission spec.",
-            "parameters": ["name", "fmt"],
-        },
-        {
-            "name": "pcs_prodtask_intake",
-            "description": "Idempotent intake of a draft ProdTask. Idempotency key: public_catalog_issue OR (public_catalog_csv_path, public_catalog_row_key). Updates existing on match; creates draft requiring name/dataset/prod_config; dataset accepts composed_name, DID, or legacy dataset_name.",
-            "parameters": ["public_catalog_issue", "public_catalog_csv_path", "public_catalog_row_key", "name", "dataset", "prod_config", "description", "input_dataset_did", "public_catalog_repo", "public_catalog_pr", "public_catalog_row_index", "public_catalog_page_url", "public_catalog_commit_sha", "created_by"],
-        },
-        {
-            "name": "pcs_prodtask_link_input",
-            "description": "Link input Dataset(s) to a ProdTask via overrides JSON. task_name accepts composed_name, legacy name, or pk. Provide one of did or dids; linked Datasets must already exist.",
-            "parameters": ["task_name", "did", "dids"],
-        },
-        {
-            "name": "pcs_prodtask_set_status",
-            "description": "Transition a ProdTask to a new lifecycle state. Allowed: draft->ready, ready->{draft,submitted}, submitted->{completed,failed}. Submission itself is not exposed via MCP — operators run pcs-task-cmd --submit locally.",
-            "parameters": ["task_name", "status"],
-        },
-    ]
     # Import lazily to avoid a package-registration cycle at module import.
     from .rucio import get_rucio_tool_discovery
-    return tools + get_rucio_tool_discovery()
+    return [*_AVAILABLE_TOOLS, *get_rucio_tool_discovery()]
@@ -6,6 +6,7 @@ Includes: system state, agents, namespaces, logs, testbed management.
 
 import logging
 from datetime import timedelta
+from django.db.models import Case, Count, F, IntegerField, Q, When
 from django.utils import timezone
 from asgiref.sync import sync_to_async
 
@@ -13,7 +14,7 @@ from monitor_app.mcp import mcp
 
 from ..models import SystemAgent, RunState, PersistentState, SystemStateEvent, AppLog
 from ..workflow_models import WorkflowExecution, WorkflowMessage, Namespace
-from .common import _parse_time, _default_start_time, _monitor_url, _get_testbed_config_path, _get_username
+from .common import _parse_time, _default_start_time, _monitor_url, _get_testbed_config_path, _load_testbed_toml, _get_username
 
 logger = logging.getLogger(__name__)
 
@@ -72,11 +73,9 @@ async def swf_get_system_state(username: str = None) -> dict:
             "config_file": str(testbed_toml.name) if testbed_toml else None,
             "config_source": config_source,
         }
-        if testbed_toml and testbed_toml.exists():
+        if testbed_toml:
             try:
-                import tomllib
-                with open(testbed_toml, 'rb') as f:
-                    toml_data = tomllib.load(f)
+                toml_data = _load_testbed_toml(testbed_toml) or {}
                 user_context["namespace"] = toml_data.get('testbed', {}).get('namespace')
                 workflow_section = toml_data.get('workflow', {})
                 user_context["workflow_name"] = workflow_section.get('name')
@@ -103,26 +102,25 @@ async def swf_get_system_state(username: str = None) -> dict:
 
         # Workflow runner status
         workflow_runner = {"status": "missing", "name": None, "last_heartbeat": None}
-        runner_qs = SystemAgent.objects.filter(
+        # One query: a runner with a recent heartbeat sorts first, so a
+        # healthy runner wins and any other live runner is the fallback.
+        runner = SystemAgent.objects.filter(
             agent_type__in=['DAQ_Simulator', 'workflow_runner'],
             namespace=user_namespace,
-            last_heartbeat__gte=recent_threshold,
-        ).exclude(operational_state='EXITED').order_by('-last_heartbeat')
-
-        if runner_qs.exists():
-            runner = runner_qs.first()
-            workflow_runner["status"] = "healthy"
+        ).exclude(operational_state='EXITED').annotate(
+            is_healthy=Case(
+                When(last_heartbeat__gte=recent_threshold, then=1),
+                default=0,
+                output_field=IntegerField(),
+            ),
+        ).order_by(
+            '-is_healthy', F('last_heartbeat').desc(nulls_last=True),
+        ).only('instance_name', 'last_heartbeat').first()
+
+        if runner:
+            workflow_runner["status"] = "healthy" if runner.is_healthy else "unhealthy"
             workflow_runner["name"] = runner.instance_name
             workflow_runner["last_heartbeat"] = runner.last_heartbeat.isoformat() if runner.last_heartbeat else None
-        else:
-            any_runner = SystemAgent.objects.filter(
-                agent_type__in=['DAQ_Simulator', 'workflow_runner'],
-                namespace=user_namespace,
-            ).exclude(operational_state='EXITED').first()
-            if any_runner:
-                workflow_runner["status"] = "unhealthy"
-                workflow_runner["name"] = any_runner.instance_name
-                workflow_runner["last_heartbeat"] = any_runner.last_heartbeat.isoformat() if any_runner.last_heartbeat else None
 
         ready_to_run = workflow_runner["status"] == "healthy"
 
@@ -150,22 +148,29 @@ async def swf_get_system_state(username: str = None) -> dict:
                 extra_data__namespace=user_namespace,
             ).count()
 
-        # Global agent stats
-        total_agents = SystemAgent.objects.count()
-        exited_agents = SystemAgent.objects.filter(operational_state='EXITED').count()
+        # Global agent stats, all counters from one scan
+        agent_stats = SystemAgent.objects.aggregate(
+            total=Count('pk'),
+            exited=Count('pk', filter=Q(operational_state='EXITED')),
+            healthy=Count('pk', filter=Q(
+                last_heartbeat__gte=recent_threshold,
+                status='OK',
+            ) & ~Q(operational_state='EXITED')),
+        )
+        total_agents = agent_stats['total']
+        exited_agents = agent_stats['exited']
         active_agents = total_agents - exited_agents
-
-        healthy_agents = SystemAgent.objects.filter(
-            last_heartbeat__gte=recent_threshold,
-            status='OK'
-        ).exclude(operational_state='EXITED').count()
+        healthy_agents = agent_stats['healthy']
 
         # Execution stats
-        running_executions = WorkflowExecution.objects.filter(status='running').count()
-        recent_completed = WorkflowExecution.objects.filter(
-            status='completed',
-            end_time__gte=now - timedelta(hours=1)
-        ).count()
+        execution_stats = WorkflowExecution.objects.filter(
+            Q(status='running') | Q(status='completed', end_time__gte=now - timedelta(hours=1))
+        ).aggregate(
+            running=Count('pk', filter=Q(status='running')),
+            completed=Count('pk', filter=Q(status='completed')),
+        )
+        running_executions = execution_stats['running']
+        recent_completed = execution_stats['completed']
 
         # Message stats
         recent_messages = WorkflowMessage.objects.filter(
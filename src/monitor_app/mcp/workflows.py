@@ -15,7 +15,7 @@ from monitor_app.mcp import mcp
 
 from ..models import Run, StfFile, TFSlice, AppLog, SystemAgent
 from ..workflow_models import WorkflowDefinition, WorkflowExecution, WorkflowMessage
-from .common import _parse_time, _default_start_time, _monitor_url, _get_testbed_config_path, _get_username
+from .common import _parse_time, _default_start_time, _monitor_url, _get_testbed_config_path, _load_testbed_toml, _get_username
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +28,8 @@ logger = logging.getLogger(__name__)
 async def swf_list_workflow_definitions(
     workflow_type: str = None,
     created_by: str = None,
+    limit: int = 100,
+    offset: int = 0,
 ) -> list:
     """
     List available workflow definitions that can be executed.
@@ -38,13 +40,19 @@ async def swf_list_workflow_definitions(
     Args:
         workflow_type: Filter by type (e.g., 'simulation', 'production')
         created_by: Filter by creator username
+        limit: Maximum definitions to return (default 100, max 100)
+        offset: Number of definitions to skip, for paging past has_more
 
     Returns list of definitions with: workflow_name, version, workflow_type,
     created_by, created_at, execution_count
     """
     @sync_to_async
     def fetch():
-        qs = WorkflowDefinition.objects.annotate(
+        # The definition code and parameter schema are not returned; leave
+        # them out of the SELECT.
+        qs = WorkflowDefinition.objects.only(
+            'workflow_name', 'version', 'workflow_type', 'created_by', 'created_at',
+        ).annotate(
             execution_count=Count('executions')
         ).order_by('workflow_name', '-version')
 
@@ -54,6 +62,8 @@ async def swf_list_workflow_definitions(
             qs = qs.filter(created_by=created_by)
 
         MAX_ITEMS = 100
+        start = max(offset or 0, 0)
+        end = start + min(max(limit or MAX_ITEMS, 1), MAX_ITEMS)
         total_count = qs.count()
         items = [
             {
@@ -64,12 +74,12 @@ async def swf_list_workflow_definitions(
                 "created_at": w.created_at.isoformat() if w.created_at else None,
                 "execution_count": w.execution_count,
             }
-            for w in qs[:MAX_ITEMS]
+            for w in qs[start:end]
         ]
         return {
             "items": items,
             "total_count": total_count,
-            "has_more": total_count > MAX_ITEMS,
+            "has_more": total_count > end,
             "monitor_urls": [
                 {"title": "Workflow Definitions", "url": _monitor_url("/workflow-definitions/")},
             ],
@@ -738,9 +748,7 @@ async def swf_start_workflow(
         testbed_toml, config_source = _get_testbed_config_path()
         if testbed_toml.exists():
             try:
-                import tomllib
-                with open(testbed_toml, 'rb') as f:
-                    toml_data = tomllib.load(f)
+                toml_data = _load_testbed_toml(testbed_toml) or {}
                 toml_namespace = toml_data.get('testbed', {}).get('namespace')
                 workflow_section = toml_data.get('workflow', {})
                 toml_workflow_name = workflow_section.get('name')
@@ -1136,11 +1144,9 @@ async def swf_send_message(message: str, message_type: str = "announcement", met
         namespace = None
         if message_type != 'test':
             testbed_toml, _ = _get_testbed_config_path()
-            if testbed_toml and testbed_toml.exists():
+            if testbed_toml:
                 try:
-                    import tomllib
-                    with open(testbed_toml, 'rb') as f:
-                        toml_data = tomllib.load(f)
+                    toml_data = _load_testbed_toml(testbed_toml) or {}
                     namespace = toml_data.get('testbed', {}).get('namespace')
                 except Exception:
                     pass
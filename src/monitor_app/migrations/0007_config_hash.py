@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('monitor_app', '0006_remove_tfslice_flat_filenames'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pandaqueue',
+            name='config_hash',
+            field=models.CharField(blank=True, default='', max_length=32),
+        ),
+        migrations.AddField(
+            model_name='rucioendpoint',
+            name='config_hash',
+            field=models.CharField(blank=True, default='', max_length=32),
+        ),
+    ]
@@ -0,0 +1,27 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('monitor_app', '0007_config_hash'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='systemagent',
+            index=models.Index(fields=['namespace', 'agent_type', '-last_heartbeat'], name='swf_sysagent_ns_type_hb_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='applog',
+            index=models.Index(condition=models.Q(('level__gte', 40)), fields=['timestamp'], name='swf_applog_error_ts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='workflowmessage',
+            index=models.Index(fields=['namespace', 'sent_at'], name='swf_wfmsg_ns_sent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='workflowmessage',
+            index=models.Index(fields=['sent_at'], name='swf_wfmsg_sent_idx'),
+        ),
+    ]
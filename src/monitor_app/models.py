@@ -177,6 +177,10 @@ class SystemAgent(models.Model):
 
     class Meta:
         db_table = 'swf_systemagent'
+        indexes = [
+            models.Index(fields=['namespace', 'agent_type', '-last_heartbeat'],
+                         name='swf_sysagent_ns_type_hb_idx'),
+        ]
 
     def __str__(self):
         return self.instance_name
@@ -202,12 +206,27 @@ class SystemAgent(models.Model):
         return count
 
     def update_stf_stats(self, increment_current=0, increment_total=0):
-        """Update STF processing statistics."""
+        """Update STF processing statistics.
+
+        The counters are incremented in SQL with a single UPDATE of just
+        these columns, so concurrent updaters never lose increments; the
+        instance's copies are advanced to match. QuerySet.update() skips
+        auto_now, so updated_at is set here as save() would have.
+        """
+        now = timezone.now()
+        fields = {
+            'current_stf_count': models.F('current_stf_count') + increment_current,
+            'total_stf_processed': models.F('total_stf_processed') + increment_total,
+            'updated_at': now,
+        }
+        if increment_total > 0:
+            fields['last_stf_processed'] = now
+        type(self).objects.filter(pk=self.pk).update(**fields)
         self.current_stf_count += increment_current
         self.total_stf_processed += increment_total
+        self.updated_at = now
         if increment_total > 0:
-            self.last_stf_processed = timezone.now()
-        self.save()
+            self.last_stf_processed = now
 
 class AppLog(models.Model):
     LEVEL_CHOICES = [
@@ -237,6 +256,9 @@ class AppLog(models.Model):
         verbose_name_plural = "App Logs"
         indexes = [
             models.Index(fields=['timestamp', 'app_name', 'instance_name']),
+            # Error-and-above rows only: small, and what error counts scan.
+            models.Index(fields=['timestamp'], condition=models.Q(level__gte=logging.ERROR),
+                         name='swf_applog_error_ts_idx'),
         ]
 
     def __str__(self):
@@ -831,6 +853,9 @@ class PandaQueue(models.Model):
     status = models.CharField(max_length=50, default='active')
     queue_type = models.CharField(max_length=50, blank=True)
     config_data = models.JSONField()
+    # Digest of config_data as last loaded; lets load_computing_configs skip
+    # rewriting unchanged entries.
+    config_hash = models.CharField(max_length=32, blank=True, default='')
     metadata = models.JSONField(default=dict, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -891,6 +916,8 @@ class RucioEndpoint(models.Model):
     is_tape = models.BooleanField(default=False)
     is_active = models.BooleanField(default=True)
     config_data = models.JSONField()
+    # Digest of config_data as last loaded (see PandaQueue.config_hash).
+    config_hash = models.CharField(max_length=32, blank=True, default='')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
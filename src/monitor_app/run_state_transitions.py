@@ -17,6 +17,7 @@ state 'ended', phase 'completed'. The lane active check accepts both
 
 import logging
 
+from django.db import transaction
 from django.utils import timezone
 
 logger = logging.getLogger(__name__)
@@ -42,48 +43,53 @@ def apply_run_lifecycle_message(data) -> bool:
         return False
 
     now = timezone.now()
-    # Agents may start mid-run or belong to workflows whose launcher did
-    # not create the row; transitions must never fall on the floor.
-    row, created = RunState.objects.get_or_create(
-        run_number=run_number,
-        defaults={
-            'phase': 'initializing',
-            'state': 'imminent',
-            'substate': 'preparing',
-            'target_worker_count': 0,
-            'state_changed_at': now,
-            'metadata': {},
-        },
-    )
+    # The read-modify-write is one transaction: a single commit per
+    # message, and the row lock keeps concurrent messages for the same
+    # run from overwriting each other. Logging and the snapper
+    # republish run after commit, outside it.
+    with transaction.atomic():
+        # Agents may start mid-run or belong to workflows whose launcher did
+        # not create the row; transitions must never fall on the floor.
+        row, created = RunState.objects.select_for_update().get_or_create(
+            run_number=run_number,
+            defaults={
+                'phase': 'initializing',
+                'state': 'imminent',
+                'substate': 'preparing',
+                'target_worker_count': 0,
+                'state_changed_at': now,
+                'metadata': {},
+            },
+        )
 
-    previous = (row.phase, row.state, row.substate)
-    if msg_type == 'end_run':
-        row.state = 'ended'
-        row.substate = None
-        row.phase = 'completed'
-    else:
-        stamped_state = data.get('state')
-        if stamped_state:
-            row.state = str(stamped_state)
-        stamped_substate = data.get('substate')
-        if stamped_substate:
-            row.substate = str(stamped_substate)
-        if msg_type in ('start_run', 'pause_run', 'resume_run'):
-            row.phase = 'physics'
-    row.state_changed_at = now
+        previous = (row.phase, row.state, row.substate)
+        if msg_type == 'end_run':
+            row.state = 'ended'
+            row.substate = None
+            row.phase = 'completed'
+        else:
+            stamped_state = data.get('state')
+            if stamped_state:
+                row.state = str(stamped_state)
+            stamped_substate = data.get('substate')
+            if stamped_substate:
+                row.substate = str(stamped_substate)
+            if msg_type in ('start_run', 'pause_run', 'resume_run'):
+                row.phase = 'physics'
+        row.state_changed_at = now
 
-    # The datataking projection joins namespace through
-    # metadata.execution_id; rows created here must carry it too.
-    metadata = row.metadata if isinstance(row.metadata, dict) else {}
-    execution_id = data.get('execution_id')
-    if execution_id and not metadata.get('execution_id'):
-        metadata['execution_id'] = execution_id
-        row.metadata = metadata
+        # The datataking projection joins namespace through
+        # metadata.execution_id; rows created here must carry it too.
+        metadata = row.metadata if isinstance(row.metadata, dict) else {}
+        execution_id = data.get('execution_id')
+        if execution_id and not metadata.get('execution_id'):
+            metadata['execution_id'] = execution_id
+            row.metadata = metadata
 
-    row.save(update_fields=[
-        'phase', 'state', 'substate', 'state_changed_at', 'metadata',
-        'updated_at',
-    ])
+        row.save(update_fields=[
+            'phase', 'state', 'substate', 'state_changed_at', 'metadata',
+            'updated_at',
+        ])
     logger.info(
         "RunState %s: %s -> %s/%s (%s)%s",
         run_number, msg_type, row.state, row.substate or '-', row.phase,
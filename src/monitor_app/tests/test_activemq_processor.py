@@ -0,0 +1,131 @@
+"""
+Tests for the ActiveMQ frame processor and its background WorkflowMessage writer.
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+from django.db import connection
+from django.test import TransactionTestCase
+
+from monitor_app.activemq_processor import WorkflowMessageProcessor, WorkflowMessageWriter
+from monitor_app.models import RunState, SystemAgent
+from monitor_app.workflow_models import WorkflowMessage
+
+
+def _frame(data):
+    frame = MagicMock()
+    frame.body = json.dumps(data).encode()
+    frame.destination = '/topic/epictopic'
+    return frame
+
+
+class WorkflowMessageWriterTests(TransactionTestCase):
+    """Frames received by on_message are stored once the writer is closed."""
+
+    def setUp(self):
+        # A long flush interval keeps every frame in one batch until close().
+        self.writer = WorkflowMessageWriter(flush_interval=5.0)
+        self.processor = WorkflowMessageProcessor(MagicMock())
+        self.processor.message_writer = self.writer
+        patcher = patch('monitor_app.activemq_processor.get_channel_layer', return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.writer.close)
+
+    def test_writer_starts_on_first_message(self):
+        self.assertIsNone(self.writer.batches._worker)
+        self.processor.on_message(_frame({'msg_type': 'test_event', 'sender': 'agent-a'}))
+        self.assertTrue(self.writer.batches._worker.is_alive())
+
+    def test_messages_written_after_close(self):
+        for i in range(3):
+            self.processor.on_message(_frame({
+                'msg_type': 'test_event', 'sender': f'agent-{i}', 'namespace': 'test-ns',
+            }))
+        self.writer.close()
+
+        rows = WorkflowMessage.objects.filter(namespace='test-ns')
+        self.assertEqual(rows.count(), 3)
+        self.assertEqual(
+            set(rows.values_list('sender_agent', flat=True)),
+            {'agent-0', 'agent-1', 'agent-2'},
+        )
+
+    def test_bad_row_does_not_drop_its_batch(self):
+        self.processor.on_message(_frame({'msg_type': 'test_event', 'sender': 'agent-a', 'namespace': 'test-ns'}))
+        # message_type is a 50-character column; this row cannot be inserted.
+        self.processor.on_message(_frame({'msg_type': 'x' * 60, 'sender': 'agent-b', 'namespace': 'test-ns'}))
+        self.processor.on_message(_frame({'msg_type': 'test_event', 'sender': 'agent-c', 'namespace': 'test-ns'}))
+        self.writer.close()
+
+        self.assertEqual(
+            sorted(WorkflowMessage.objects.filter(namespace='test-ns')
+                   .values_list('sender_agent', flat=True)),
+            ['agent-a', 'agent-c'],
+        )
+
+    def test_wide_integers_survive_parsing(self):
+        self.processor.on_message(_frame({
+            'msg_type': 'test_event', 'namespace': 'test-ns', 'counter': 2 ** 70,
+        }))
+        self.writer.close()
+
+        message = WorkflowMessage.objects.get(namespace='test-ns')
+        self.assertEqual(message.message_content['counter'], 2 ** 70)
+
+    def test_non_object_frames_are_ignored(self):
+        with self.assertNoLogs('monitor_app.activemq_processor', level='WARNING'):
+            for body in ([1, 2], 'text', 42, None):
+                self.processor.on_message(_frame(body))
+        self.writer.close()
+        self.assertFalse(WorkflowMessage.objects.exists())
+
+    def test_close_without_messages_is_a_no_op(self):
+        self.writer.close()
+        self.assertIsNone(self.writer.batches._worker)
+
+
+class ListenerConnectionTests(TransactionTestCase):
+    """A DB connection dropped between frames is replaced before the next frame's writes."""
+
+    def setUp(self):
+        self.writer = WorkflowMessageWriter(flush_interval=5.0)
+        self.processor = WorkflowMessageProcessor(MagicMock())
+        self.processor.message_writer = self.writer
+        patcher = patch('monitor_app.activemq_processor.get_channel_layer', return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.writer.close)
+
+    def _drop_connection(self):
+        # Close the driver connection underneath Django, as a server-side
+        # disconnect would; Django still holds it and has seen no error.
+        connection.ensure_connection()
+        connection.connection.close()
+
+    def test_run_transition_after_dropped_connection_persists(self):
+        self.processor.on_message(_frame({
+            'msg_type': 'start_run', 'run_id': 101, 'namespace': 'test-ns',
+            'state': 'run', 'substate': 'physics',
+        }))
+        self.assertEqual(RunState.objects.get(run_number=101).state, 'run')
+
+        self._drop_connection()
+        with patch('monitor_app.batch_queue.CONNECTION_IDLE_CHECK_SECONDS', 0):
+            self.processor.on_message(_frame({
+                'msg_type': 'end_run', 'run_id': 101, 'namespace': 'test-ns',
+            }))
+
+        run_state = RunState.objects.get(run_number=101)
+        self.assertEqual(run_state.state, 'ended')
+        self.assertEqual(run_state.phase, 'completed')
+
+    def test_heartbeat_after_dropped_connection_persists(self):
+        self.processor.on_message(_frame({'agent_name': 'agent-a', 'status': 'OK'}))
+
+        self._drop_connection()
+        with patch('monitor_app.batch_queue.CONNECTION_IDLE_CHECK_SECONDS', 0):
+            self.processor.on_message(_frame({'agent_name': 'agent-a', 'status': 'WARNING'}))
+
+        self.assertEqual(SystemAgent.objects.get(instance_name='agent-a').status, 'WARNING')
@@ -111,6 +111,60 @@ class ActiveMQSSLConnectionTests(TestCase):
         except ImportError as e:
             self.fail(f"Failed to import ActiveMQ components: {e}")
             
+    def test_connection_manager_config_cached(self):
+        """ActiveMQ settings are read once per manager until reload_config()"""
+        from django.test import override_settings
+        from monitor_app.activemq_connection import ActiveMQConnectionManager
+
+        manager = ActiveMQConnectionManager()
+        manager.reload_config()
+        try:
+            with override_settings(ACTIVEMQ_HEARTBEAT_TOPIC='topic-a'):
+                self.assertEqual(manager.config.topic, 'topic-a')
+            with override_settings(ACTIVEMQ_HEARTBEAT_TOPIC='topic-b'):
+                self.assertEqual(manager.config.topic, 'topic-a')
+                manager.reload_config()
+                self.assertEqual(manager.config.topic, 'topic-b')
+        finally:
+            manager.reload_config()
+
+    def test_concurrent_connect_opens_one_connection(self):
+        """A connect() that waits on an in-flight handshake reuses its connection"""
+        if not self.stomp_available:
+            self.skipTest("stomp.py not available")
+
+        import threading
+        from unittest.mock import patch
+        from monitor_app.activemq_connection import ActiveMQConnectionManager
+
+        manager = ActiveMQConnectionManager()
+        manager.disconnect()
+        in_handshake = threading.Event()
+        release = threading.Event()
+        state = {'connected': False}
+
+        def slow_handshake(*args, **kwargs):
+            in_handshake.set()
+            release.wait(timeout=5)
+            state['connected'] = True
+
+        with patch('stomp.Connection') as mock_connection_class:
+            mock_connection = mock_connection_class.return_value
+            mock_connection.connect.side_effect = slow_handshake
+            mock_connection.is_connected.side_effect = lambda: state['connected']
+
+            first = threading.Thread(target=manager.connect)
+            first.start()
+            self.assertTrue(in_handshake.wait(timeout=5))
+            second = threading.Thread(target=manager.connect)
+            second.start()
+            release.set()
+            first.join(timeout=5)
+            second.join(timeout=5)
+
+            self.assertEqual(mock_connection_class.call_count, 1)
+            manager.disconnect()
+
     def test_activemq_ssl_connection_attempt(self):
         """Test actual SSL connection attempt (will fail if service not available)"""
         if not self.stomp_available:
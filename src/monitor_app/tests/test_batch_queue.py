@@ -0,0 +1,98 @@
+"""
+Tests for the background batching queue shared by the WorkflowMessage
+writer and the AppLog handler.
+"""
+
+import queue
+import threading
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from monitor_app.batch_queue import BatchQueue
+
+
+class BatchQueueTests(SimpleTestCase):
+
+    def setUp(self):
+        self.batches = []
+        self.written = threading.Event()
+
+    def _write(self, batch):
+        self.batches.append(list(batch))
+        self.written.set()
+
+    def _queue(self, **kwargs):
+        options = {'batch_size': 100, 'flush_interval': 5.0}
+        options.update(kwargs)
+        q = BatchQueue(self._write, 'test-batch-queue', **options)
+        self.addCleanup(q.close)
+        return q
+
+    def test_thread_starts_on_first_put(self):
+        q = self._queue()
+        self.assertIsNone(q._worker)
+        q.put_nowait(1)
+        self.assertTrue(q._worker.is_alive())
+
+    def test_close_flushes_pending_items(self):
+        q = self._queue()
+        for i in range(5):
+            q.put_nowait(i)
+        q.close()
+        self.assertFalse(q._worker.is_alive())
+        self.assertEqual([i for batch in self.batches for i in batch], list(range(5)))
+
+    def test_full_batch_written_without_waiting(self):
+        q = self._queue(batch_size=3)
+        for i in range(3):
+            q.put_nowait(i)
+        self.assertTrue(self.written.wait(timeout=2.0))
+        self.assertEqual(self.batches[0], [0, 1, 2])
+
+    def test_partial_batch_written_after_flush_interval(self):
+        q = self._queue(flush_interval=0.05)
+        q.put_nowait('a')
+        self.assertTrue(self.written.wait(timeout=2.0))
+        self.assertEqual(self.batches, [['a']])
+
+    def test_write_error_does_not_stop_the_thread(self):
+        calls = []
+
+        def failing_write(batch):
+            calls.append(list(batch))
+            if len(calls) == 1:
+                raise RuntimeError('boom')
+
+        q = BatchQueue(failing_write, 'test-batch-queue', batch_size=1, flush_interval=5.0)
+        self.addCleanup(q.close)
+        q.put_nowait('first')
+        q.put_nowait('second')
+        q.close()
+        self.assertEqual(calls, [['first'], ['second']])
+
+    def test_put_raises_when_full(self):
+        release = threading.Event()
+        q = BatchQueue(lambda batch: release.wait(timeout=2.0), 'test-batch-queue',
+                       batch_size=1, flush_interval=5.0, queue_size=1)
+        self.addCleanup(q.close)
+        self.addCleanup(release.set)
+        q.put_nowait('held by the writer')
+        # The writer may not have taken the first item yet; fill until full.
+        with self.assertRaises(queue.Full):
+            for i in range(3):
+                q.put_nowait(i)
+
+    def test_close_without_items_is_a_no_op(self):
+        q = self._queue()
+        q.close()
+        self.assertIsNone(q._worker)
+
+    def test_connection_checked_before_each_write(self):
+        q = self._queue(batch_size=1)
+        with patch('monitor_app.batch_queue.ensure_usable_connection') as ensure:
+            q.put_nowait('first')
+            q.put_nowait('second')
+            q.close()
+        self.assertEqual(ensure.call_count, 2)
+        self.assertEqual(self.batches, [['first'], ['second']])
@@ -0,0 +1,55 @@
+"""
+Tests for DataTablesProcessor response building.
+"""
+
+import json
+
+from django.test import RequestFactory, SimpleTestCase
+
+from monitor_app.utils import DataTablesProcessor
+
+
+class CreateResponseTests(SimpleTestCase):
+
+    def _processor(self, length=100):
+        request = RequestFactory().get('/', {'draw': 2, 'start': 0, 'length': length})
+        return DataTablesProcessor(request, ['name', 'value'])
+
+    def test_small_page_is_a_json_response(self):
+        response = self._processor().create_response([['a', 1]], 10, 1)
+        self.assertFalse(response.streaming)
+        self.assertEqual(json.loads(response.content)['data'], [['a', 1]])
+
+    def test_large_row_list_is_a_json_response(self):
+        rows = [[f'row-{i}', i] for i in range(1000)]
+        response = self._processor(length=1000).create_response(rows, 5000, 1000)
+        self.assertFalse(response.streaming)
+        self.assertEqual(json.loads(response.content)['data'], rows)
+
+    def test_large_row_iterator_streams_in_blocks(self):
+        dt = self._processor(length=1000)
+        rows = [[f'row-{i}', i] for i in range(1000)]
+        response = dt.create_response(iter(rows), 5000, 1000, extra={'product_age_seconds': 1.5})
+        self.assertTrue(response.streaming)
+        chunks = list(response.streaming_content)
+        # Envelope, one chunk per block of rows, closing bracket.
+        self.assertEqual(len(chunks), 2 + 1000 // dt.STREAM_BLOCK_ROWS)
+        data = json.loads(b''.join(chunks))
+        self.assertEqual(data['draw'], 2)
+        self.assertEqual(data['recordsTotal'], 5000)
+        self.assertEqual(data['product_age_seconds'], 1.5)
+        self.assertEqual(data['data'], rows)
+
+    def test_row_iterable_follows_requested_length(self):
+        small = self._processor(length=10).create_response(iter([['a', 1]]), 1, 1)
+        self.assertFalse(small.streaming)
+        self.assertEqual(json.loads(small.content)['data'], [['a', 1]])
+
+        large = self._processor(length=1000).create_response(
+            (['r', i] for i in range(250)), 250, 250)
+        self.assertTrue(large.streaming)
+        self.assertEqual(len(json.loads(b''.join(large.streaming_content))['data']), 250)
+
+    def test_empty_streamed_page_is_valid_json(self):
+        response = self._processor(length=1000).create_response(iter([]), 0, 0)
+        self.assertEqual(json.loads(b''.join(response.streaming_content))['data'], [])
@@ -0,0 +1,69 @@
+"""
+Tests for the FastMon files DataTables endpoint.
+"""
+
+import json
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from monitor_app.models import FastMonFile, Run, StfFile
+
+
+class FastMonFilesDatatableTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='fastmon_user', password='password')
+        self.client.login(username='fastmon_user', password='password')
+        run = Run.objects.create(run_number=4242, start_time=timezone.now())
+        other_run = Run.objects.create(run_number=77, start_time=timezone.now())
+        stf = StfFile.objects.create(run=run, stf_filename='run4242_0001.stf')
+        other_stf = StfFile.objects.create(run=other_run, stf_filename='run77_0001.stf')
+        FastMonFile.objects.create(stf_file=stf, tf_filename='run4242_0001_tf001.tf')
+        FastMonFile.objects.create(stf_file=other_stf, tf_filename='run77_0001_tf001.tf')
+        self.url = reverse('monitor_app:fastmon_files_datatable_ajax')
+
+    def _get(self, **params):
+        response = self.client.get(self.url, {'draw': 1, 'start': 0, 'length': 10, **params})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_numeric_search_matches_run_number(self):
+        data = self._get(**{'search[value]': '77'})
+        self.assertEqual(data['recordsTotal'], 2)
+        self.assertEqual(data['recordsFiltered'], 1)
+
+    def test_non_decimal_digit_search_does_not_error(self):
+        # '²'.isdigit() is True but int('²') raises ValueError.
+        data = self._get(**{'search[value]': '²'})
+        self.assertEqual(data['recordsFiltered'], 0)
+
+    def test_response_carries_product_freshness(self):
+        data = self._get()
+        self.assertIsNotNone(data['product_built_at'])
+        self.assertIn('product_age_seconds', data)
+        self.assertIn('product_refreshing', data)
+
+    def test_refresh_rebuilds_the_total(self):
+        self.assertEqual(self._get()['recordsTotal'], 2)
+        FastMonFile.objects.create(stf_file=StfFile.objects.get(stf_filename='run77_0001.stf'),
+                                   tf_filename='run77_0001_tf002.tf')
+        self.assertEqual(self._get(refresh='1')['recordsTotal'], 3)
+
+    def test_large_page_streams_valid_json(self):
+        stf = StfFile.objects.get(stf_filename='run77_0001.stf')
+        FastMonFile.objects.bulk_create(
+            FastMonFile(stf_file=stf, tf_filename=f'run77_0001_tf{i:04d}.tf')
+            for i in range(2, 602)
+        )
+        response = self.client.get(self.url, {'draw': 3, 'start': 0, 'length': 1000,
+                                              'refresh': '1'})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        data = json.loads(b''.join(response.streaming_content))
+        self.assertEqual(data['draw'], 3)
+        self.assertEqual(data['recordsTotal'], 602)
+        self.assertEqual(len(data['data']), 602)
+        self.assertIn('product_built_at', data)
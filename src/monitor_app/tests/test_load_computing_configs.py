@@ -0,0 +1,110 @@
+"""
+Tests for the load_computing_configs management command.
+"""
+
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from monitor_app.models import PandaQueue, RucioEndpoint
+
+
+QUEUES = {
+    'BNL_QUEUE_A': {'site': 'BNL', 'type': 'production', 'status': 'online'},
+    'BNL_QUEUE_B': {'site': 'BNL', 'type': 'analysis', 'status': 'offline'},
+}
+ENDPOINTS = {
+    'BNL_DATADISK': {'rcsite': 'BNL', 'is_tape': False, 'rc_site_state': 'ACTIVE'},
+    'BNL_TAPE': {'rcsite': 'BNL', 'is_tape': True, 'rc_site_state': 'DISABLED'},
+}
+
+
+class LoadComputingConfigsTests(TestCase):
+
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.config_dir = Path(tmpdir.name)
+        self._write('panda_queues.json', QUEUES)
+        self._write('ddm_endpoints.json', ENDPOINTS)
+
+    def _write(self, name, data):
+        (self.config_dir / name).write_text(json.dumps(data))
+
+    def _load(self, *args):
+        out = StringIO()
+        call_command('load_computing_configs', '--config-dir', str(self.config_dir),
+                     *args, stdout=out)
+        return out.getvalue()
+
+    def test_initial_load_creates_everything(self):
+        output = self._load()
+        self.assertIn('PanDA queues: 2 created, 0 updated, 0 unchanged', output)
+        self.assertIn('Rucio endpoints: 2 created, 0 updated, 0 unchanged', output)
+        self.assertEqual(PandaQueue.objects.get(queue_name='BNL_QUEUE_B').status, 'offline')
+        tape = RucioEndpoint.objects.get(endpoint_name='BNL_TAPE')
+        self.assertEqual(tape.endpoint_type, 'tape')
+        self.assertFalse(tape.is_active)
+
+    def test_reload_counts_updated_and_unchanged(self):
+        self._load()
+        self._write('panda_queues.json', {
+            **QUEUES,
+            'BNL_QUEUE_A': {**QUEUES['BNL_QUEUE_A'], 'status': 'offline'},
+            'BNL_QUEUE_C': {'site': 'BNL', 'type': 'production'},
+        })
+        output = self._load()
+        self.assertIn('PanDA queues: 1 created, 1 updated, 1 unchanged', output)
+        self.assertIn('Rucio endpoints: 0 created, 0 updated, 2 unchanged', output)
+        self.assertEqual(PandaQueue.objects.get(queue_name='BNL_QUEUE_A').status, 'offline')
+
+    def test_metadata_survives_reload(self):
+        self._load()
+        PandaQueue.objects.filter(queue_name='BNL_QUEUE_A').update(
+            metadata={'ai_content_ids': [7], 'note': 'keep me'})
+        self._write('panda_queues.json', {
+            **QUEUES,
+            'BNL_QUEUE_A': {**QUEUES['BNL_QUEUE_A'], 'type': 'unified'},
+        })
+        self._load()
+        queue = PandaQueue.objects.get(queue_name='BNL_QUEUE_A')
+        self.assertEqual(queue.queue_type, 'unified')
+        self.assertEqual(queue.metadata, {'ai_content_ids': [7], 'note': 'keep me'})
+
+    def test_clear_keeps_queues_with_ai_content(self):
+        PandaQueue.objects.create(queue_name='ANNOTATED', config_data={},
+                                  metadata={'ai_content_ids': [1]})
+        PandaQueue.objects.create(queue_name='STALE', config_data={},
+                                  metadata={'note': 'no links'})
+        RucioEndpoint.objects.create(endpoint_name='STALE_DISK', config_data={})
+        self._load('--clear')
+        self.assertEqual(
+            set(PandaQueue.objects.values_list('queue_name', flat=True)),
+            {'ANNOTATED', 'BNL_QUEUE_A', 'BNL_QUEUE_B'},
+        )
+        self.assertFalse(RucioEndpoint.objects.filter(endpoint_name='STALE_DISK').exists())
+
+    def test_failed_load_rolls_back_clear(self):
+        PandaQueue.objects.create(queue_name='EXISTING', config_data={})
+        RucioEndpoint.objects.create(endpoint_name='EXISTING_DISK', config_data={})
+        (self.config_dir / 'ddm_endpoints.json').write_text('{not json')
+        output = self._load('--clear')
+        self.assertIn('Error loading Rucio endpoints', output)
+        self.assertIn('clear rolled back', output)
+        self.assertEqual(
+            list(PandaQueue.objects.values_list('queue_name', flat=True)), ['EXISTING'])
+        self.assertEqual(
+            list(RucioEndpoint.objects.values_list('endpoint_name', flat=True)),
+            ['EXISTING_DISK'],
+        )
+
+    def test_config_path_that_is_a_file_is_reported(self):
+        output = StringIO()
+        call_command('load_computing_configs', '--config-dir',
+                     str(self.config_dir / 'panda_queues.json'), stdout=output)
+        self.assertIn('Config directory not found', output.getvalue())
+        self.assertFalse(PandaQueue.objects.exists())
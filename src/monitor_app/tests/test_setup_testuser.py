@@ -0,0 +1,35 @@
+"""
+Tests for the setup_testuser management command.
+"""
+
+from io import StringIO
+
+from django.contrib.auth import authenticate
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+
+
+class SetupTestuserTests(TestCase):
+
+    def _run(self, password):
+        out = StringIO()
+        call_command('setup_testuser', '--password', password, stdout=out)
+        return out.getvalue()
+
+    def test_creates_user_that_can_log_in(self):
+        output = self._run('first-password')
+        self.assertIn('Created new user "testuser"', output)
+        user = User.objects.get(username='testuser')
+        self.assertEqual(user.email, 'testuser@example.com')
+        self.assertEqual(authenticate(username='testuser', password='first-password'), user)
+
+    def test_rerun_updates_password_only(self):
+        self._run('first-password')
+        User.objects.filter(username='testuser').update(email='changed@example.com')
+        output = self._run('second-password')
+        self.assertIn('Updated password for existing user "testuser"', output)
+        self.assertEqual(User.objects.filter(username='testuser').count(), 1)
+        self.assertIsNone(authenticate(username='testuser', password='first-password'))
+        user = authenticate(username='testuser', password='second-password')
+        self.assertEqual(user.email, 'changed@example.com')
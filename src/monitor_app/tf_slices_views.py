@@ -4,7 +4,6 @@ TF Slices views for fast processing workflow monitoring.
 
 from django.db.models import F
 from django.shortcuts import render
-from django.http import JsonResponse
 from django.urls import reverse
 from .models import TFSlice
 from .utils import DataTablesProcessor, get_filter_params, format_datetime
@@ -122,9 +121,4 @@ def tf_slices_datatable_ajax(request):
         ])
 
     # Return DataTables-formatted response
-    return JsonResponse({
-        'draw': dt.draw,
-        'recordsTotal': records_total,
-        'recordsFiltered': records_filtered,
-        'data': data
-    })
+    return dt.create_response(data, records_total, records_filtered)
@@ -3,7 +3,8 @@ Common utility functions for the monitor application.
 """
 from datetime import timedelta
 from django.utils import timezone
-from django.http import JsonResponse
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse, StreamingHttpResponse
 from django.db.models import Q
 
 
@@ -126,7 +127,13 @@ class DataTablesProcessor:
     Common processor for server-side DataTables AJAX requests.
     Handles pagination, searching, ordering, and filtering consistently.
     """
-    
+
+    # Pages of lazily produced rows requesting at least this many rows are
+    # streamed in blocks of STREAM_BLOCK_ROWS instead of being serialized
+    # into a single body. Row lists are always returned whole.
+    STREAM_ROWS_THRESHOLD = 500
+    STREAM_BLOCK_ROWS = 200
+
     def __init__(self, request, columns, default_order_column=0, default_order_direction='desc'):
         """
         Initialize DataTables processor with request parameters.
@@ -211,7 +218,9 @@ class DataTablesProcessor:
         Create standardized DataTables JSON response.
 
         Args:
-            data: List of data rows for the table
+            data: List of data rows for the table, or an iterator yielding
+                them (e.g. rows formatted from a queryset iterator); only
+                an iterator is ever streamed
             records_total: Total number of records before filtering
             records_filtered: Number of records after filtering
             extra: Optional dict merged into the response — e.g. the
@@ -219,17 +228,47 @@ class DataTablesProcessor:
                 "as of" chip reads (docs/CACHED_PRODUCTS.md).
 
         Returns:
-            JsonResponse object
+            JsonResponse, or StreamingHttpResponse for a large page of
+            lazily produced rows
         """
         payload = {
             'draw': self.draw,
             'recordsTotal': records_total,
             'recordsFiltered': records_filtered,
-            'data': data
         }
         if extra:
             payload.update(extra)
-        return JsonResponse(payload)
+        # A built list is already in memory, so streaming it would save
+        # nothing and would turn an error mid-body into a truncated 200.
+        if (isinstance(data, (list, tuple))
+                or 0 <= self.length < self.STREAM_ROWS_THRESHOLD):
+            payload['data'] = list(data)
+            return JsonResponse(payload)
+        return StreamingHttpResponse(
+            self._stream_payload(payload, data),
+            content_type='application/json',
+        )
+
+    @classmethod
+    def _stream_payload(cls, payload, data):
+        """
+        Yield the response JSON piecewise: the envelope, then the rows in
+        blocks of STREAM_BLOCK_ROWS. Each yielded chunk is a socket write
+        under WSGI, so rows are joined rather than sent one per chunk.
+        """
+        encoder = DjangoJSONEncoder()
+        yield encoder.encode(payload)[:-1] + ', "data": ['
+        block = []
+        separator = ''
+        for row in data:
+            block.append(encoder.encode(row))
+            if len(block) >= cls.STREAM_BLOCK_ROWS:
+                yield separator + ', '.join(block)
+                block = []
+                separator = ', '
+        if block:
+            yield separator + ', '.join(block)
+        yield ']}'
 
 
 def get_filter_params(request, param_names):
@@ -21,6 +21,7 @@ from datetime import datetime, timedelta
 from datetime import timezone as datetime_timezone
 from urllib.parse import urlencode
 
+from django.db.models import Count, Q
 from django.http import JsonResponse
 from django.utils import timezone
 from rest_framework.authentication import TokenAuthentication
@@ -129,18 +130,22 @@ def _user_testbed_summary(username, now):
     else:
         namespace = owned_namespace
 
-    agents = []
+    # Only the fresh/stale/error tallies are reported, so classify in the
+    # database and fetch three counts rather than every agent row.
+    agent_counts = {'total': 0, 'fresh': 0, 'error': 0}
     if namespace:
-        agents = list(SystemAgent.objects.filter(namespace=namespace)
-                      .exclude(instance_name=f'agent-manager-{username}')
-                      .exclude(operational_state='EXITED')
-                      .order_by('-last_heartbeat'))
-    fresh_agents = [
-        agent for agent in agents
-        if agent.last_heartbeat and agent.last_heartbeat >= healthy_after
-    ]
-    stale_agents = [agent for agent in agents if agent not in fresh_agents]
-    error_agents = [agent for agent in fresh_agents if agent.status == 'ERROR']
+        is_fresh = Q(last_heartbeat__gte=healthy_after)
+        agent_counts = (SystemAgent.objects.filter(namespace=namespace)
+                        .exclude(instance_name=f'agent-manager-{username}')
+                        .exclude(operational_state='EXITED')
+                        .aggregate(
+                            total=Count('pk'),
+                            fresh=Count('pk', filter=is_fresh),
+                            error=Count('pk', filter=is_fresh & Q(status='ERROR')),
+                        ))
+    fresh_agents = agent_counts['fresh']
+    stale_agents = agent_counts['total'] - fresh_agents
+    error_agents = agent_counts['error']
     running_workflows = executions.filter(status='running').count()
     stale_workflows = executions.filter(
         status='running', end_time__isnull=True,
@@ -156,7 +161,7 @@ def _user_testbed_summary(username, now):
         color = 'green'
     else:
         color = None
-    display_count = len(fresh_agents)
+    display_count = fresh_agents
     label = f'testbed {display_count}'
 
     return {
@@ -172,9 +177,9 @@ def _user_testbed_summary(username, now):
         },
         'agents': {
             'display_count': display_count,
-            'fresh': len(fresh_agents),
-            'stale': len(stale_agents),
-            'error': len(error_agents),
+            'fresh': fresh_agents,
+            'stale': stale_agents,
+            'error': error_agents,
         },
         'workflows': {
             'running': running_workflows,
@@ -1385,8 +1385,17 @@ def stf_files_list(request):
     # Status and machine state are the humanly-choosable filter sets;
     # run enumerations are not filters — deep-link parameters still
     # apply and search covers targeted lookups.
+    # The machine-state set is a DISTINCT over the whole STF table and
+    # changes rarely, so it is served as a cached product.
+    from .cached_product import get_product
     statuses = [choice[0] for choice in StfFile._meta.get_field('status').choices]
-    machine_states = StfFile.objects.values_list('machine_state', flat=True).distinct()
+    machine_states = get_product(
+        'stf_machine_states',
+        lambda: sorted(s for s in (StfFile.objects.order_by()
+                                   .values_list('machine_state', flat=True)
+                                   .distinct()) if s),
+        ttl_seconds=300,
+    )['value'] or []
     
     # Column definitions for DataTables
     columns = [
@@ -1405,7 +1414,7 @@ def stf_files_list(request):
         'ajax_url': reverse('monitor_app:stf_files_datatable_ajax'),
         'columns': columns,
         'statuses': statuses,
-        'machine_states': sorted([s for s in machine_states if s]),
+        'machine_states': machine_states,
         'selected_run_number': run_number,
         'selected_status': status_filter,
         'selected_machine_state': machine_state,
@@ -2031,9 +2040,11 @@ def workflow_messages_datatable_ajax(request):
         # Try to find workflow by filename
         try:
             if workflow_value != 'N/A':
-                workflow_obj = STFWorkflow.objects.filter(filename=workflow_value).first()
-                if workflow_obj:
-                    filter_params['workflow'] = workflow_obj.workflow_id
+                # Only the id is needed; don't load the workflow's JSON metadata.
+                workflow_id = (STFWorkflow.objects.filter(filename=workflow_value)
+                               .values_list('workflow_id', flat=True).first())
+                if workflow_id:
+                    filter_params['workflow'] = workflow_id
                 else:
                     # Filter out all results if workflow not found
                     queryset = queryset.none()
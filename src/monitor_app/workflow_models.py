@@ -310,6 +310,8 @@ class WorkflowMessage(models.Model):
             models.Index(fields=['message_type', 'sent_at']),
             models.Index(fields=['namespace', 'execution_id']),
             models.Index(fields=['namespace', 'run_id']),
+            models.Index(fields=['namespace', 'sent_at'], name='swf_wfmsg_ns_sent_idx'),
+            models.Index(fields=['sent_at'], name='swf_wfmsg_sent_idx'),
         ]
 
     def __str__(self):
@@ -176,6 +176,16 @@ DATABASES = {
         "PASSWORD": config("DB_PASSWORD", default="dummy"),
         "HOST": config("DB_HOST", default="localhost"),
         "PORT": config("DB_PORT", default="5432"),
+        # Per-request connections by default: the same settings load in the
+        # uvicorn MCP worker, where persistent connections are not safe.
+        # The ActiveMQ listener keeps its own thread's connection open
+        # regardless and validates it itself
+        # (batch_queue.ensure_usable_connection).
+        "CONN_MAX_AGE": config("DB_CONN_MAX_AGE", default=0, cast=int),
+        # Only takes effect with DB_CONN_MAX_AGE > 0: request-serving
+        # processes then reuse connections across requests, and this checks
+        # a reused connection before the request's first query.
+        "CONN_HEALTH_CHECKS": True,
     },
 }
 